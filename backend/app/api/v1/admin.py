@@ -20,6 +20,7 @@ from app.models.association import Association
 from app.models.point_event import PointEvent
 from app.models.custom_word import CustomWord
 from app.services.gamification import get_level_info
+from app.services.sorting_hat import SortingHatService
 from app.auth.dependencies import get_current_user, require_admin
 from app.api.v1.push import notify_admins
 
@@ -247,6 +248,7 @@ async def delete_word(
         raise HTTPException(status_code=404, detail="Word not found")
     await db.delete(word)
     await db.commit()
+    SortingHatService.invalidate_word_cache()
     return {"success": True, "deleted_id": word_id}
 
 
@@ -264,6 +266,7 @@ async def add_word(
     word = Word(english=body.english.strip(), hebrew=body.hebrew.strip(), unit=body.unit)
     db.add(word)
     await db.commit()
+    SortingHatService.invalidate_word_cache()
     await db.refresh(word)
     return {
         "success": True,
@@ -606,6 +609,7 @@ async def approve_custom_word(
     db.add(new_word)
     cw.admin_status = "approved"
     await db.commit()
+    SortingHatService.invalidate_word_cache()
     await db.refresh(new_word)
 
     return {
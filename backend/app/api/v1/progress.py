@@ -148,8 +148,7 @@ async def get_batch_triage_words(
     db: AsyncSession = Depends(get_db),
 ) -> dict:
     """Get a batch of words for triage mode (one API call covers many swipes)."""
-    stats = await ProgressService.get_user_stats(db, current_user.id)
-    user_level = stats["level"]
+    user_level = current_user.level
 
     words, remaining = await ProgressService.get_batch_triage_words(
         db, current_user.id, user_level, limit, language
@@ -174,8 +173,7 @@ async def get_next_triage_word(
     db: AsyncSession = Depends(get_db),
 ) -> dict:
     """Get next word for triage mode."""
-    stats = await ProgressService.get_user_stats(db, current_user.id)
-    user_level = stats["level"]
+    user_level = current_user.level
 
     word, remaining = await ProgressService.get_next_triage_word(
         db, current_user.id, user_level, language
@@ -6,6 +6,7 @@ import os
 from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 # Read DATABASE_URL from environment.
 # Render provides postgres:// — SQLAlchemy 2 needs postgresql+asyncpg://
@@ -25,6 +26,12 @@ _is_postgres = DATABASE_URL.startswith("postgresql")
 _engine_kwargs: dict = {"echo": False, "future": True}
 if _is_postgres:
     _engine_kwargs["pool_pre_ping"] = True  # detect stale connections
+elif os.getenv("SQLITE_POOL_SIZE"):
+    # Opt-in for the test scripts: aiosqlite defaults to NullPool (a new
+    # connection and worker thread per session); reuse a small fixed pool instead.
+    _engine_kwargs["poolclass"] = AsyncAdaptedQueuePool
+    _engine_kwargs["pool_size"] = int(os.environ["SQLITE_POOL_SIZE"])
+    _engine_kwargs["max_overflow"] = 0
 
 engine = create_async_engine(DATABASE_URL, **_engine_kwargs)
 
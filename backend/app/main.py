@@ -75,6 +75,23 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                 "UPDATE user_word_progress SET learning_state = 'graduated' WHERE status = 'Mastered' AND learning_state = 'learning'",
                 # Custom word admin moderation queue
                 "ALTER TABLE custom_words ADD COLUMN IF NOT EXISTS admin_status VARCHAR(20) DEFAULT 'pending' NOT NULL",
+                # Partial index for the crowd-sourced difficulty aggregate
+                "CREATE INDEX IF NOT EXISTS ix_uwp_word_status_nonew ON user_word_progress (word_id, status) WHERE status != 'New'",
+                "CREATE INDEX IF NOT EXISTS ix_uwp_user_status ON user_word_progress (user_id, status)",
+                # Review queue lookups (due / upcoming / never reviewed)
+                "CREATE INDEX IF NOT EXISTS ix_uwp_user_next ON user_word_progress (user_id, next_review)",
+                "CREATE INDEX IF NOT EXISTS ix_uwp_user_status_null ON user_word_progress (user_id, status) WHERE next_review IS NULL",
+                # SM-2 fields as typed columns; backfill from the srs_data JSON once
+                # (clearing it), so later startups never overwrite newer values
+                "ALTER TABLE user_word_progress ADD COLUMN IF NOT EXISTS repetition_number INTEGER DEFAULT 0 NOT NULL",
+                "ALTER TABLE user_word_progress ADD COLUMN IF NOT EXISTS easiness_factor DOUBLE PRECISION DEFAULT 2.5 NOT NULL",
+                "ALTER TABLE user_word_progress ADD COLUMN IF NOT EXISTS interval_days INTEGER DEFAULT 0 NOT NULL",
+                "UPDATE user_word_progress SET "
+                "repetition_number = COALESCE((srs_data->>'repetition_number')::numeric::int, 0), "
+                "easiness_factor = COALESCE((srs_data->>'easiness_factor')::float, 2.5), "
+                "interval_days = COALESCE((srs_data->>'interval_days')::numeric::int, 0), "
+                "srs_data = NULL "
+                "WHERE srs_data IS NOT NULL",
             ]
             for migration_sql in migrations:
                 try:
@@ -110,6 +127,22 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                 "UPDATE user_word_progress SET learning_state = 'graduated' WHERE status = 'Mastered' AND learning_state = 'learning'",
                 # Custom word admin moderation queue
                 "ALTER TABLE custom_words ADD COLUMN admin_status VARCHAR(20) DEFAULT 'pending' NOT NULL",
+                # Partial index for the crowd-sourced difficulty aggregate
+                "CREATE INDEX IF NOT EXISTS ix_uwp_word_status_nonew ON user_word_progress (word_id, status) WHERE status != 'New'",
+                "CREATE INDEX IF NOT EXISTS ix_uwp_user_status ON user_word_progress (user_id, status)",
+                # Review queue lookups (due / upcoming / never reviewed)
+                "CREATE INDEX IF NOT EXISTS ix_uwp_user_next ON user_word_progress (user_id, next_review)",
+                "CREATE INDEX IF NOT EXISTS ix_uwp_user_status_null ON user_word_progress (user_id, status) WHERE next_review IS NULL",
+                # SM-2 fields as typed columns; backfill from the srs_data JSON once
+                "ALTER TABLE user_word_progress ADD COLUMN repetition_number INTEGER DEFAULT 0 NOT NULL",
+                "ALTER TABLE user_word_progress ADD COLUMN easiness_factor FLOAT DEFAULT 2.5 NOT NULL",
+                "ALTER TABLE user_word_progress ADD COLUMN interval_days INTEGER DEFAULT 0 NOT NULL",
+                "UPDATE user_word_progress SET "
+                "repetition_number = COALESCE(CAST(json_extract(srs_data, '$.repetition_number') AS INTEGER), 0), "
+                "easiness_factor = COALESCE(json_extract(srs_data, '$.easiness_factor'), 2.5), "
+                "interval_days = COALESCE(CAST(json_extract(srs_data, '$.interval_days') AS INTEGER), 0), "
+                "srs_data = NULL "
+                "WHERE srs_data IS NOT NULL",
             ]
             for migration_sql in migrations:
                 try:
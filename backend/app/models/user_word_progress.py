@@ -2,7 +2,7 @@
 from typing import TYPE_CHECKING, Optional, Dict, Any
 from datetime import datetime
 from enum import Enum as PyEnum
-from sqlalchemy import Integer, ForeignKey, DateTime, JSON, Enum as SQLEnum, String
+from sqlalchemy import Integer, Float, ForeignKey, DateTime, JSON, Enum as SQLEnum, String, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.session import Base
@@ -40,10 +40,13 @@ class UserWordProgress(Base):
         status: Current learning status (New, Learning, Review, Mastered).
         learning_state: Two-phase state ('learning' = Phase 1, 'graduated' = Phase 2 SM-2).
         next_review: Timestamp for when the word should be reviewed next.
-        srs_data: JSON field storing SM-2 algorithm data:
-            - repetition_number: Number of successful reviews
-            - easiness_factor: E-Factor (quality of recall, typically 1.3-2.5)
-            - interval_days: Current interval between reviews in days
+        repetition_number: SM-2 count of successful reviews.
+        easiness_factor: SM-2 E-Factor (quality of recall, typically 1.3-2.5).
+        interval_days: SM-2 interval between reviews in days.
+        legacy_srs_data: Old JSON copy of the SM-2 fields (the srs_data column).
+            Backfilled into the typed columns and cleared at startup; kept
+            mapped only until the column is dropped.
+        srs_data: Read-only dict view of the SM-2 columns (API compatibility).
         user: Relationship to User (Many-to-One).
         word: Relationship to Word (Many-to-One).
     """
@@ -65,20 +68,47 @@ class UserWordProgress(Base):
         server_default="learning",
     )
     next_review: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
-    srs_data: Mapped[Optional[Dict[str, Any]]] = mapped_column(
-        JSON,
-        nullable=True,
-        default=lambda: {
-            "repetition_number": 0,
-            "easiness_factor": 2.5,
-            "interval_days": 0,
-        },
-    )
+    repetition_number: Mapped[int] = mapped_column(Integer, default=0, nullable=False, server_default="0")
+    easiness_factor: Mapped[float] = mapped_column(Float, default=2.5, nullable=False, server_default="2.5")
+    interval_days: Mapped[int] = mapped_column(Integer, default=0, nullable=False, server_default="0")
+    legacy_srs_data: Mapped[Optional[Dict[str, Any]]] = mapped_column("srs_data", JSON, nullable=True)
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="progress")
     word: Mapped["Word"] = relationship("Word", back_populates="progress_records")
 
+    __table_args__ = (
+        # Partial index for DifficultyService's per-word aggregate over non-NEW rows
+        Index(
+            "ix_uwp_word_status_nonew",
+            "word_id",
+            "status",
+            postgresql_where=text("status != 'New'"),
+            sqlite_where=text("status != 'New'"),
+        ),
+        # Covers get_user_stats' per-user GROUP BY status as an index-only scan
+        Index("ix_uwp_user_status", "user_id", "status"),
+        # ReviewService: due/upcoming range scans and ORDER BY next_review LIMIT n
+        Index("ix_uwp_user_next", "user_id", "next_review"),
+        # ReviewService: never-reviewed LEARNING words (next_review IS NULL)
+        Index(
+            "ix_uwp_user_status_null",
+            "user_id",
+            "status",
+            postgresql_where=text("next_review IS NULL"),
+            sqlite_where=text("next_review IS NULL"),
+        ),
+    )
+
+    @property
+    def srs_data(self) -> Dict[str, Any]:
+        """SM-2 fields in the shape the API has always returned."""
+        return {
+            "repetition_number": self.repetition_number,
+            "easiness_factor": self.easiness_factor,
+            "interval_days": self.interval_days,
+        }
+
     def __repr__(self) -> str:
         return (
             f"<UserWordProgress(id={self.id}, user_id={self.user_id}, "
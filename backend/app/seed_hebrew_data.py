@@ -55,8 +55,9 @@ async def seed_words(session: AsyncSession, words: list[dict]):
 
     # Step 1: Wipe only Hebrew words
     print(f"\n[1/4] Wiping language='he' words...")
+    # Not committed yet: the wipe and the insert land as one transaction,
+    # so a failed insert leaves the old words in place.
     await session.execute(delete(Word).where(Word.language == "he"))
-    await session.commit()
     print("      Done — Hebrew words removed.")
 
     # Step 2: Insert
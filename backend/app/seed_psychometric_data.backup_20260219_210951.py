@@ -3,14 +3,18 @@ Seed script for Israeli Psychometric Entrance Test vocabulary.
 Populates database with 400 authentic psychometric words.
 Difficulty ranks assigned based on word frequency and linguistic complexity.
 Difficulty mapping: 1-20 levels with difficulty_rank 1-100 (Level = ceil(difficulty_rank / 5)).
+
+Backup of an older seeder: the current Word model has no difficulty_rank
+column (words are grouped by unit), so this no longer runs against it.
 """
 import asyncio
 import sys
-from sqlalchemy import select, delete
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import TYPE_CHECKING
 
-from app.db.session import engine, AsyncSessionLocal, Base
-from app.models.word import Word
+# SQLAlchemy, the engine and the ORM models are imported inside the async
+# functions below, so importing this module only builds PSYCHOMETRIC_WORDS.
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 
 # 400 authentic Israeli Psychometric Test words
@@ -461,34 +465,56 @@ PSYCHOMETRIC_WORDS = [
 ]
 
 
-async def seed_words(session: AsyncSession):
+# Rows per multi-row INSERT on drivers without COPY
+INSERT_BATCH_SIZE = 1000
+
+
+async def _copy_words(session: "AsyncSession", records: list[tuple]) -> None:
+    """COPY (english, hebrew, difficulty_rank) rows into words on the session's asyncpg connection."""
+    conn = await session.connection()
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        "words",
+        records=records,
+        columns=["english", "hebrew", "difficulty_rank"],
+    )
+
+
+async def seed_words(session: "AsyncSession"):
     """Seed the database with authentic Israeli Psychometric Test vocabulary."""
+    from sqlalchemy import select, delete, func, insert
+
+    from app.db.session import DIALECT
+    from app.models.word import Word
+
     print("\n[SEEDING] Starting Israeli Psychometric vocabulary seeding...")
 
     # Clear existing words
     print("[INFO] Wiping existing word database...")
     await session.execute(delete(Word))
-    await session.commit()
     print("[CLEARED] All existing words deleted.")
 
-    # Insert authentic psychometric words
-    words_added = 0
-    for word_data in PSYCHOMETRIC_WORDS:
-        word = Word(
-            english=word_data["english"],
-            hebrew=word_data["hebrew"],
-            difficulty_rank=word_data["difficulty_rank"]
-        )
-        session.add(word)
-        words_added += 1
-
+    records = [
+        (w["english"], w["hebrew"], w["difficulty_rank"])
+        for w in PSYCHOMETRIC_WORDS
+    ]
+
+    # Insert authentic psychometric words: COPY on asyncpg, batched multi-row
+    # INSERT ... VALUES elsewhere. Neither goes through the ORM unit of work.
+    # The wipe and the load share one transaction.
+    if DIALECT == "postgresql":
+        await _copy_words(session, records)
+    else:
+        for i in range(0, len(PSYCHOMETRIC_WORDS), INSERT_BATCH_SIZE):
+            batch = PSYCHOMETRIC_WORDS[i:i + INSERT_BATCH_SIZE]
+            await session.execute(insert(Word).values(batch))
     await session.commit()
+    words_added = len(records)
     print(f"[SUCCESS] Added {words_added} authentic psychometric words to database.")
 
     # Verify seeding
-    stmt = select(Word)
-    result = await session.execute(stmt)
-    total_words = len(result.scalars().all())
+    result = await session.execute(select(func.count()).select_from(Word))
+    total_words = result.scalar_one()
     print(f"[VERIFY] Total words in database: {total_words}")
 
     # Show difficulty distribution by level (1-20)
@@ -496,20 +522,24 @@ async def seed_words(session: AsyncSession):
     print("  (Level = ceil(difficulty_rank / 5))")
     print()
 
+    # One GROUP BY round-trip instead of a query per level
+    level_expr = ((Word.difficulty_rank - 1) // 5 + 1).label("level")
+    # Group by the output alias so PostgreSQL doesn't see two differently bound expressions
+    stmt = select(level_expr, func.count()).group_by("level").order_by("level")
+    result = await session.execute(stmt)
+    level_counts = {level: count for level, count in result.all()}
+
     for level in range(1, 21):
         min_rank = (level - 1) * 5 + 1
         max_rank = level * 5
-        stmt = select(Word).where(
-            Word.difficulty_rank >= min_rank,
-            Word.difficulty_rank <= max_rank
-        )
-        result = await session.execute(stmt)
-        count = len(result.scalars().all())
+        count = level_counts.get(level, 0)
         print(f"  Level {level:2d} (ranks {min_rank:2d}-{max_rank:3d}): {count} words")
 
 
 async def main():
     """Main function to run the seeder."""
+    from app.db.session import engine, AsyncSessionLocal, Base
+
     print("=" * 70)
     print("🇮🇱 ISRAELI PSYCHOMETRIC ENTRANCE TEST VOCABULARY SEEDER 🇮🇱")
     print("=" * 70)
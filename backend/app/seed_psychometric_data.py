@@ -1,6 +1,9 @@
 """
 Seed script for Israeli Psychometric Entrance Test vocabulary.
 SOURCE: database_english.json (project root) — no words generated manually.
+Pass another file in the same {"Unit N": {english: hebrew}} layout to seed it
+instead, e.g. the root generators' output:
+    python -m app.seed_psychometric_data ../seed_psychometric_words.json
 
 Unit assignment:
 - 10 units → each word is assigned its source unit number (1-10)
@@ -9,66 +12,80 @@ NOTE: Only replaces language='en' words. Hebrew words are untouched.
       Run seed_hebrew_data.py separately to seed Hebrew words.
 """
 import asyncio
-import json
 import sys
 from pathlib import Path
-from sqlalchemy import delete, func, select
+import orjson
+from sqlalchemy import delete, func, insert, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import engine, AsyncSessionLocal, Base
+from app.db.session import engine, AsyncSessionLocal, Base, DIALECT
 from app.models.word import Word
 
 # Resolve JSON path relative to this file (PsychoApp/database_english.json)
 JSON_PATH = Path(__file__).resolve().parent.parent.parent / "database_english.json"
 
+# Rows per multi-row INSERT on drivers without COPY
+INSERT_BATCH_SIZE = 1000
 
-def load_words_from_json() -> list[dict]:
-    """Read database_english.json and return list of word dicts with unit."""
-    if not JSON_PATH.exists():
-        raise FileNotFoundError(f"JSON file not found at: {JSON_PATH}")
+# Column order of the records returned by load_words_from_json()
+WORD_COLUMNS = ("english", "hebrew", "unit", "language")
 
-    with open(JSON_PATH, encoding="utf-8") as f:
-        data = json.load(f)
 
-    words = []
-    units = sorted(data.keys(), key=lambda u: int(u.split()[-1]))  # sort Unit 1..10
+def load_words_from_json(json_path: Path = JSON_PATH) -> list[tuple[str, str, int, str]]:
+    """Read database_english.json (or json_path) and return (english, hebrew, unit, language) records."""
+    if not json_path.exists():
+        raise FileNotFoundError(f"JSON file not found at: {json_path}")
 
-    for unit_idx, unit_name in enumerate(units):
-        unit_number = unit_idx + 1  # 1-based
+    data = orjson.loads(json_path.read_bytes())
 
-        entries = data[unit_name]
-        for english, hebrew in entries.items():
-            words.append({
-                "english": english,
-                "hebrew": hebrew,
-                "unit": unit_number,
-                "language": "en",
-            })
+    # Other top-level keys (e.g. the generators' source_sha256) are metadata
+    units = sorted(
+        (key for key in data if key.startswith("Unit ")),
+        key=lambda u: int(u.split()[-1]),  # sort Unit 1..10
+    )
 
-    return words
+    # Tuples in WORD_COLUMNS order go straight to COPY with no per-word dict
+    return [
+        (english, hebrew, unit_idx + 1, "en")  # unit numbers are 1-based
+        for unit_idx, unit_name in enumerate(units)
+        for english, hebrew in data[unit_name].items()
+    ]
 
 
-async def seed_words(session: AsyncSession, words: list[dict]):
+async def seed_words(session: AsyncSession, words: list[tuple[str, str, int, str]]):
     """Replace language='en' words and insert all words from JSON."""
     print("\n" + "=" * 60)
     print("  PSYCHOMETRIC VOCABULARY SEEDER — database_english.json")
     print("=" * 60)
 
+    # A lost seed can simply be re-run, so skip the WAL fsync on commit.
+    # SET LOCAL only applies to this transaction.
+    if DIALECT == "postgresql":
+        await session.execute(text("SET LOCAL synchronous_commit = off"))
+
     # Step 1: Wipe only English words
     print(f"\n[1/4] Wiping language='en' words...")
+    # Not committed yet: the wipe and the insert land as one transaction,
+    # so a failed insert leaves the old words in place.
     await session.execute(delete(Word).where(Word.language == "en"))
-    await session.commit()
     print("      Done — English words removed.")
 
     # Step 2: Insert
     print(f"\n[2/4] Inserting {len(words)} English words from JSON...")
-    for w in words:
-        session.add(Word(
-            english=w["english"],
-            hebrew=w["hebrew"],
-            unit=w["unit"],
-            language="en",
-        ))
+    if DIALECT == "postgresql":
+        # COPY skips per-row INSERT statements and the ORM unit of work
+        conn = await session.connection()
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            "words",
+            records=words,
+            columns=list(WORD_COLUMNS),
+        )
+    else:
+        # One multi-row INSERT ... VALUES per batch, kept well under bind-param limits
+        for i in range(0, len(words), INSERT_BATCH_SIZE):
+            batch = [dict(zip(WORD_COLUMNS, w)) for w in words[i:i + INSERT_BATCH_SIZE]]
+            await session.execute(insert(Word).values(batch))
     await session.commit()
     print("      Insert committed.")
 
@@ -91,9 +108,9 @@ async def seed_words(session: AsyncSession, words: list[dict]):
     print("=" * 60 + "\n")
 
 
-async def main():
-    print(f"Reading from: {JSON_PATH}")
-    words = load_words_from_json()
+async def main(json_path: Path = JSON_PATH):
+    print(f"Reading from: {json_path}")
+    words = load_words_from_json(json_path)
     print(f"Loaded {len(words)} words from JSON.")
 
     # Drop and recreate all tables (full schema reset including new language column)
@@ -113,4 +130,4 @@ if __name__ == "__main__":
             import codecs
             sys.stdout = codecs.getwriter("utf-8")(sys.stdout.buffer, "strict")
 
-    asyncio.run(main())
+    asyncio.run(main(Path(sys.argv[1]) if len(sys.argv) > 1 else JSON_PATH))
@@ -16,9 +16,14 @@ For each word, across ALL users:
 Mapping to 1-20 scale (matching the existing difficulty_rank on Word):
   success_rate = 1.0  →  level 1   (everybody knows it — easiest)
   success_rate = 0.0  →  level 20  (nobody can remember it — hardest)
-  formula: level = round(1 + (1 - success_rate) * 19)
+  formula: level = round(1 + (1 - success_rate) * 19)   (ties round up)
+
+The whole computation runs in the database: one UPDATE ... FROM over the
+per-word aggregate, with no per-word rows fetched into Python.
 """
-from sqlalchemy import select, func, case, update
+import functools
+
+from sqlalchemy import select, func, case, update, literal_column
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.word import Word
@@ -31,29 +36,27 @@ class DifficultyService:
     MAX_LEVEL = 20
 
     @staticmethod
-    def _success_rate_to_level(success_rate: float) -> int:
-        """Map a [0.0, 1.0] success rate to the [1, 20] difficulty scale."""
-        level = round(1.0 + (1.0 - success_rate) * 19.0)
-        return max(DifficultyService.MIN_LEVEL, min(DifficultyService.MAX_LEVEL, level))
+    def _level_expr(successes, total):
+        """
+        SQL expression mapping successes / total to the [1, 20] difficulty scale.
 
-    @staticmethod
-    async def recalculate_all(db: AsyncSession) -> dict:
+        Integer-only so PostgreSQL and SQLite agree: round-half-up of a / b is
+        (2a + b) // 2b, hence ties round toward the harder level.
         """
-        Recalculate global_difficulty_level for every word that has review data.
+        span = DifficultyService.MAX_LEVEL - DifficultyService.MIN_LEVEL
+        failures = total - successes
+        return DifficultyService.MIN_LEVEL + (2 * span * failures + total) // (2 * total)
 
-        Words with no UserWordProgress records (never touched by any user) are left at
-        NULL — they have no crowd-sourced signal yet.
+    @staticmethod
+    @functools.cache
+    def _levels_subquery():
+        """
+        Per-word difficulty levels as a subquery, built once per process.
 
-        Returns a summary dict:
-            {
-                "total_words":        int,   # all words in DB
-                "words_updated":      int,   # words that had data and were updated
-                "words_without_data": int,   # words with no review data (kept NULL)
-                "level_distribution": {1: n, 2: n, ...},  # counts per level
-            }
+        Every part of it (the status CASE, the aggregate, the level formula) is
+        constant, so later calls reuse the same construct instead of rebuilding
+        the expression tree each run.
         """
-        # ── 1. Aggregate per-word success counts across all users ──────────────
-        #
         # We count only non-NEW records because NEW means the user has never
         # actually clicked "I Know It" or "I Don't Know" on that word.
         #
@@ -67,65 +70,84 @@ class DifficultyService:
                 )
             ),
             0,
-        ).label("successes")
+        )
 
-        stats_stmt = (
+        stats = (
             select(
                 UserWordProgress.word_id,
-                func.count(UserWordProgress.id).label("total"),
-                successes_expr,
+                # COUNT(*) rather than COUNT(id) keeps this answerable from
+                # ix_uwp_word_status_nonew alone (an index-only scan)
+                func.count().label("total"),
+                successes_expr.label("successes"),
             )
-            .where(UserWordProgress.status != WordStatus.NEW)
+            # Same literal as the index predicate, not a bound parameter, so the
+            # planner can match ix_uwp_word_status_nonew under prepared statements
+            .where(UserWordProgress.status != literal_column("'New'"))
             .group_by(UserWordProgress.word_id)
+            .subquery("stats")
         )
 
-        rows = (await db.execute(stats_stmt)).all()
+        return select(
+            stats.c.word_id,
+            DifficultyService._level_expr(stats.c.successes, stats.c.total).label("level"),
+        ).subquery("levels")
 
-        if not rows:
-            total_words_count = (await db.execute(select(func.count(Word.id)))).scalar() or 0
-            return {
-                "total_words": total_words_count,
-                "words_updated": 0,
-                "words_without_data": total_words_count,
-                "level_distribution": {},
-            }
+    @staticmethod
+    @functools.cache
+    def _update_stmt():
+        """UPDATE words ... FROM levels — the aggregate, formula and write in one statement."""
+        levels = DifficultyService._levels_subquery()
+        return (
+            update(Word)
+            .where(Word.id == levels.c.word_id)
+            .values(global_difficulty_level=levels.c.level)
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    @functools.cache
+    def _distribution_stmt():
+        """Word count per difficulty level, over the same levels subquery."""
+        levels = DifficultyService._levels_subquery()
+        return (
+            select(levels.c.level, func.count())
+            .group_by(levels.c.level)
+            .order_by(levels.c.level)
+        )
 
-        # ── 2. Compute a difficulty level for each word that has data ──────────
-        difficulty_map: dict[int, int] = {}
-        level_distribution: dict[int, int] = {i: 0 for i in range(1, 21)}
+    @staticmethod
+    async def recalculate_all(db: AsyncSession) -> dict:
+        """
+        Recalculate global_difficulty_level for every word that has review data.
 
-        for row in rows:
-            if row.total == 0:
-                continue
-            success_rate = row.successes / row.total
-            level = DifficultyService._success_rate_to_level(success_rate)
-            difficulty_map[row.word_id] = level
-            level_distribution[level] += 1
+        Words with no UserWordProgress records (never touched by any user) are left at
+        NULL — they have no crowd-sourced signal yet.
 
-        # ── 3. Bulk-update words that have data ───────────────────────────────
+        Returns a summary dict:
+            {
+                "total_words":        int,   # all words in DB
+                "words_updated":      int,   # words that had data and were updated
+                "words_without_data": int,   # words with no review data (kept NULL)
+                "level_distribution": {1: n, 2: n, ...},  # counts per level
+            }
+        """
+        # ── 1. Update every word that has data in one UPDATE ... FROM ─────────
         #
-        # Use a single prepared statement executed with multiple parameter sets —
-        # much faster than N individual UPDATE queries.
-        if difficulty_map:
-            # SQLAlchemy 2.0 ORM "bulk UPDATE by primary key":
-            # pass a list of dicts that include the PK field ("id") and the
-            # columns to set.  SQLAlchemy generates a single prepared statement
-            # executed N times — much faster than individual UPDATE calls.
-            await db.execute(
-                update(Word).execution_options(synchronize_session=False),
-                [{"id": wid, "global_difficulty_level": lvl} for wid, lvl in difficulty_map.items()],
-            )
+        # No per-word rows travel to Python and back: the aggregate, the level
+        # formula and the write all run in a single statement.
+        result = await db.execute(DifficultyService._update_stmt())
+        words_updated = result.rowcount
 
         await db.commit()
 
-        # ── 4. Build response summary ──────────────────────────────────────────
+        # ── 2. Build response summary ──────────────────────────────────────────
+        distribution_rows = (await db.execute(DifficultyService._distribution_stmt())).all()
         total_words_count = (await db.execute(select(func.count(Word.id)))).scalar() or 0
-        words_updated = len(difficulty_map)
         words_without_data = total_words_count - words_updated
 
         return {
             "total_words": total_words_count,
             "words_updated": words_updated,
             "words_without_data": words_without_data,
-            "level_distribution": {k: v for k, v in level_distribution.items() if v > 0},
+            "level_distribution": {level: count for level, count in distribution_rows},
         }
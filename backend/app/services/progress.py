@@ -1,8 +1,9 @@
 """
 Progress service for managing user word progress and triage mode.
 """
+import random
 from datetime import date as date_type
-from sqlalchemy import select, func, and_
+from sqlalchemy import BigInteger, Select, select, func, and_, literal
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
@@ -12,6 +13,54 @@ from app.models.word_interaction_event import WordInteractionEvent
 
 UNIT_WORD_TOTALS_EN = {1: 283, 2: 376, 3: 359, 4: 379, 5: 384, 6: 386, 7: 387, 8: 404, 9: 388, 10: 396}
 
+# Resolution of the random fraction used to pick a triage word in SQL.
+# Bound as BIGINT: asyncpg would otherwise cast it to INTEGER, and 2**31
+# is out of int32 range.
+_PICK_SCALE = 2 ** 31
+
+
+def _untriaged_by(user_id: int):
+    """
+    WHERE clause matching words the user has no progress record for.
+
+    A correlated NOT EXISTS keeps the filtering in the database instead of
+    shipping every triaged word id back as a NOT IN (...) parameter list.
+    """
+    return ~(
+        select(UserWordProgress.id)
+        .where(UserWordProgress.user_id == user_id)
+        .where(UserWordProgress.word_id == Word.id)
+        .exists()
+    )
+
+
+def _triage_pick_stmt(user_id: int, unit_number: int, language: str, pick: int) -> Select:
+    """
+    SELECT (Word, remaining) for the untriaged word at random position `pick`.
+
+    One round-trip for both the pick and the count: number the candidates by
+    id, count them with a window, and keep the row whose position matches
+    pick / _PICK_SCALE of that count. The arithmetic stays integer-only on
+    both PostgreSQL and SQLite and nobody sorts on random().
+    """
+    candidates = (
+        select(
+            Word.id,
+            func.row_number().over(order_by=Word.id).label("position"),
+            func.count().over().label("remaining"),
+        )
+        .where(Word.unit == unit_number)
+        .where(Word.language == language)
+        .where(_untriaged_by(user_id))
+        .subquery("candidates")
+    )
+    offset = (literal(pick, BigInteger) * candidates.c.remaining) // literal(_PICK_SCALE, BigInteger)
+    return (
+        select(Word, candidates.c.remaining)
+        .join(candidates, Word.id == candidates.c.id)
+        .where(candidates.c.position == 1 + offset)
+    )
+
 
 class ProgressService:
     """Service for managing user progress and learning queue."""
@@ -63,11 +112,9 @@ class ProgressService:
                 status=status,
                 learning_state="graduated" if is_known else "learning",
                 next_review=func.now() if not is_known else None,
-                srs_data={
-                    "repetition_number": 0,
-                    "easiness_factor": 2.5,
-                    "interval_days": 0,
-                }
+                repetition_number=0,
+                easiness_factor=2.5,
+                interval_days=0,
             )
             db.add(progress)
             message = f"Word marked as {'Mastered' if is_known else 'Learning'}!"
@@ -119,39 +166,28 @@ class ProgressService:
                 "total_words": 0,
             }
 
-        # Count words by status
-        stmt = select(func.count(UserWordProgress.id)).where(
-            UserWordProgress.user_id == user_id,
-            UserWordProgress.status == WordStatus.MASTERED
-        )
-        result = await db.execute(stmt)
-        words_mastered = result.scalar() or 0
-
-        stmt = select(func.count(UserWordProgress.id)).where(
-            UserWordProgress.user_id == user_id,
-            UserWordProgress.status == WordStatus.LEARNING
-        )
-        result = await db.execute(stmt)
-        words_learning = result.scalar() or 0
-
-        stmt = select(func.count(UserWordProgress.id)).where(
-            UserWordProgress.user_id == user_id,
-            UserWordProgress.status == WordStatus.REVIEW
+        # Count words by status (one GROUP BY instead of a COUNT per status)
+        stmt = (
+            select(UserWordProgress.status, func.count())
+            .where(UserWordProgress.user_id == user_id)
+            .group_by(UserWordProgress.status)
         )
         result = await db.execute(stmt)
-        words_in_review = result.scalar() or 0
+        status_counts = {status: count for status, count in result.all()}
+        words_mastered = status_counts.get(WordStatus.MASTERED, 0)
+        words_learning = status_counts.get(WordStatus.LEARNING, 0)
+        words_in_review = status_counts.get(WordStatus.REVIEW, 0)
 
         # Get total words in database
         stmt = select(func.count(Word.id))
         result = await db.execute(stmt)
         total_words = result.scalar() or 0
 
-        # Midnight reset: clear daily counter if it's a new day
+        # Midnight reset: a counter last touched before today reads as 0.
+        # Nothing is written here — every endpoint that bumps the counter
+        # already resets it at the day boundary, so the dashboard stays read-only.
         today = date_type.today()
-        if user.last_active_date != today and user.daily_words_reviewed > 0:
-            user.daily_words_reviewed = 0
-            await db.commit()
-            await db.refresh(user)
+        daily_words_reviewed = user.daily_words_reviewed if user.last_active_date == today else 0
 
         # Get review stats
         from app.services.review_service import ReviewService
@@ -169,7 +205,7 @@ class ProgressService:
             "new_learning_count": review_stats["new_count"],
             "reviews_today": review_stats["total_reviews_today"],
             "current_streak": user.current_streak,
-            "daily_words_reviewed": user.daily_words_reviewed,
+            "daily_words_reviewed": daily_words_reviewed,
             "daily_goal": 15,
         }
 
@@ -260,35 +296,14 @@ class ProgressService:
             Tuple of (Word, remaining_count).
         """
         unit_number = max(1, min(100, user_level))
-
-        stmt = select(UserWordProgress.word_id).where(
-            UserWordProgress.user_id == user_id
-        )
-        result = await db.execute(stmt)
-        triaged_word_ids = [row[0] for row in result.all()]
-
-        stmt = (
-            select(Word)
-            .where(Word.unit == unit_number)
-            .where(Word.language == language)
-        )
-        if triaged_word_ids:
-            stmt = stmt.where(Word.id.not_in(triaged_word_ids))
-
-        stmt = stmt.order_by(func.random()).limit(1)
+        stmt = _triage_pick_stmt(user_id, unit_number, language, random.randrange(_PICK_SCALE))
         result = await db.execute(stmt)
-        word = result.scalar_one_or_none()
+        row = result.one_or_none()
 
-        count_stmt = (
-            select(func.count(Word.id))
-            .where(Word.unit == unit_number)
-            .where(Word.language == language)
-        )
-        if triaged_word_ids:
-            count_stmt = count_stmt.where(Word.id.not_in(triaged_word_ids))
+        if row is None:
+            return None, 0
 
-        result = await db.execute(count_stmt)
-        remaining = result.scalar() or 0
+        word, remaining = row
 
         return word, remaining
 
@@ -302,21 +317,19 @@ class ProgressService:
     ) -> tuple[list[Word], int]:
         """Return up to `count` random untriaged words + total remaining count."""
         unit_number = max(1, min(100, user_level))
+        untriaged = _untriaged_by(user_id)
 
-        stmt = select(UserWordProgress.word_id).where(UserWordProgress.user_id == user_id)
-        result = await db.execute(stmt)
-        triaged_word_ids = [row[0] for row in result.all()]
-
-        stmt = select(Word).where(Word.unit == unit_number).where(Word.language == language)
-        if triaged_word_ids:
-            stmt = stmt.where(Word.id.not_in(triaged_word_ids))
+        stmt = select(Word).where(Word.unit == unit_number).where(Word.language == language).where(untriaged)
         stmt = stmt.order_by(func.random()).limit(count)
         result = await db.execute(stmt)
         words = list(result.scalars().all())
 
-        count_stmt = select(func.count(Word.id)).where(Word.unit == unit_number).where(Word.language == language)
-        if triaged_word_ids:
-            count_stmt = count_stmt.where(Word.id.not_in(triaged_word_ids))
+        count_stmt = (
+            select(func.count(Word.id))
+            .where(Word.unit == unit_number)
+            .where(Word.language == language)
+            .where(untriaged)
+        )
         result = await db.execute(count_stmt)
         remaining = result.scalar() or 0
 
@@ -2,7 +2,7 @@
 Review service for managing SRS review sessions with SM-2 algorithm.
 """
 from datetime import datetime, timedelta
-from sqlalchemy import select, func, or_
+from sqlalchemy import select, func, or_, and_, case, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
@@ -10,6 +10,10 @@ from app.models.word import Word
 from app.models.user_word_progress import UserWordProgress, WordStatus
 from app.models.word_interaction_event import WordInteractionEvent
 
+# SM-2 EF adjustment per quality: EF' = EF + (0.1 - (5-q) * (0.08 + (5-q) * 0.02)).
+# Evaluated once per q with the same expression, so results are bit-identical.
+_EF_DELTA = tuple(0.1 - (5 - q) * (0.08 + (5 - q) * 0.02) for q in range(6))
+
 
 class ReviewService:
     """Service for managing spaced repetition review sessions."""
@@ -42,9 +46,8 @@ class ReviewService:
         if quality < 0 or quality > 5:
             raise ValueError("Quality must be between 0 and 5")
 
-        # Calculate new easiness factor
-        # Formula: EF' = EF + (0.1 - (5-q) * (0.08 + (5-q) * 0.02))
-        new_ef = easiness_factor + (0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+        # Calculate new easiness factor (see _EF_DELTA)
+        new_ef = easiness_factor + _EF_DELTA[quality]
 
         # Bound easiness factor: minimum 1.3
         new_ef = max(1.3, new_ef)
@@ -97,9 +100,10 @@ class ReviewService:
         Returns:
             List of (UserWordProgress, Word) tuples ordered by priority
         """
-        # Query for due words and new learning words
-        stmt = (
-            select(UserWordProgress, Word)
+        # Query for due words and new learning words (lambda_stmt caches the
+        # compiled SQL; user_id/language/limit are extracted as bound params)
+        stmt = lambda_stmt(
+            lambda: select(UserWordProgress, Word)
             .join(Word, UserWordProgress.word_id == Word.id)
             .where(UserWordProgress.user_id == user_id)
             .where(Word.language == language)
@@ -143,29 +147,26 @@ class ReviewService:
         Returns:
             List of (UserWordProgress | None, Word) tuples
         """
-        from sqlalchemy import and_
-
-        # Fetch words in the unit with a left outer join on user progress
-        # select_from(Word) ensures Word is the driving table so UserWordProgress
-        # can be None for words the user has never seen.
-        stmt = (
-            select(UserWordProgress, Word)
-            .select_from(Word)
-            .outerjoin(
-                UserWordProgress,
-                and_(
-                    UserWordProgress.word_id == Word.id,
-                    UserWordProgress.user_id == user_id,
-                )
-            )
+        # Two index-driven queries instead of a NULL-padded outer join:
+        # the unit's words, then this user's progress rows for just those ids
+        words_stmt = (
+            select(Word)
             .where(Word.unit == unit_number)
             .where(Word.language == language)
             .order_by(Word.id)
             .limit(limit)
         )
+        words = (await db.execute(words_stmt)).scalars().all()
+        if not words:
+            return []
 
-        result = await db.execute(stmt)
-        return result.all()
+        progress_stmt = select(UserWordProgress).where(
+            UserWordProgress.user_id == user_id,
+            UserWordProgress.word_id.in_([w.id for w in words]),
+        )
+        progress_by_word = {p.word_id: p for p in (await db.execute(progress_stmt)).scalars()}
+
+        return [(progress_by_word.get(w.id), w) for w in words]
 
     @staticmethod
     async def submit_review(
@@ -196,9 +197,11 @@ class ReviewService:
             ValueError: If progress record not found or quality invalid
         """
         # Fetch progress record
-        stmt = select(UserWordProgress).where(
-            UserWordProgress.user_id == user_id,
-            UserWordProgress.word_id == word_id
+        stmt = lambda_stmt(
+            lambda: select(UserWordProgress).where(
+                UserWordProgress.user_id == user_id,
+                UserWordProgress.word_id == word_id
+            )
         )
         result = await db.execute(stmt)
         progress = result.scalar_one_or_none()
@@ -210,37 +213,22 @@ class ReviewService:
                 word_id=word_id,
                 status=WordStatus.LEARNING,
                 next_review=None,
-                srs_data={
-                    "repetition_number": 0,
-                    "easiness_factor": 2.5,
-                    "interval_days": 0,
-                }
+                repetition_number=0,
+                easiness_factor=2.5,
+                interval_days=0,
             )
+            # Inserted once at commit with its final SM-2 values (no early flush)
             db.add(progress)
-            await db.flush()  # assign id without committing
-
-        # Extract current SRS data
-        srs_data = progress.srs_data or {
-            "repetition_number": 0,
-            "easiness_factor": 2.5,
-            "interval_days": 0,
-        }
-
-        repetition_number = srs_data.get("repetition_number", 0)
-        easiness_factor = srs_data.get("easiness_factor", 2.5)
-        interval_days = srs_data.get("interval_days", 0)
 
         # Calculate new SM-2 parameters
         new_repetition, new_ef, new_interval = ReviewService.calculate_sm2(
-            quality, repetition_number, easiness_factor, interval_days
+            quality, progress.repetition_number, progress.easiness_factor, progress.interval_days
         )
 
         # Update SRS data
-        progress.srs_data = {
-            "repetition_number": new_repetition,
-            "easiness_factor": new_ef,
-            "interval_days": new_interval,
-        }
+        progress.repetition_number = new_repetition
+        progress.easiness_factor = new_ef
+        progress.interval_days = new_interval
 
         # Calculate next review date
         progress.next_review = datetime.utcnow() + timedelta(days=new_interval)
@@ -262,8 +250,9 @@ class ReviewService:
             outcome=str(quality),
         ))
 
+        # No refresh: every field read below was set here, and the session
+        # doesn't expire attributes on commit
         await db.commit()
-        await db.refresh(progress)
 
         # Prepare result info
         status_change = progress.status != old_status
@@ -330,7 +319,7 @@ class ReviewService:
         Correct answer (quality >= 3):
           • learning_state → 'graduated'
           • status         → REVIEW
-          • srs_data       → rep=1, ef=2.5, interval=1
+          • SM-2 fields    → rep=1, ef=2.5, interval=1
           • next_review    → tomorrow (UTC)
 
         Incorrect answer (quality < 3):
@@ -354,11 +343,9 @@ class ReviewService:
         if quality >= 3 and progress.learning_state == "learning":
             progress.learning_state = "graduated"
             progress.status = WordStatus.REVIEW
-            progress.srs_data = {
-                "repetition_number": 1,
-                "easiness_factor": 2.5,
-                "interval_days": 1,
-            }
+            progress.repetition_number = 1
+            progress.easiness_factor = 2.5
+            progress.interval_days = 1
             progress.next_review = datetime.utcnow() + timedelta(days=1)
             graduated = True
 
@@ -413,34 +400,36 @@ class ReviewService:
                 'next_review_time': datetime | None  # Earliest next review
             }
         """
-        # Count due words (next_review in past)
-        due_stmt = select(func.count(UserWordProgress.id)).where(
-            UserWordProgress.user_id == user_id,
-            UserWordProgress.next_review <= func.now(),
-            UserWordProgress.next_review.is_not(None)
+        # One round-trip: conditional aggregates over the user's progress rows
+        #   due_count        — next_review in the past
+        #   new_count        — LEARNING words never reviewed (next_review IS NULL)
+        #   next_review_time — earliest upcoming review
+        stmt = lambda_stmt(
+            lambda: select(
+                func.sum(case((UserWordProgress.next_review <= func.now(), 1), else_=0)).label("due_count"),
+                func.sum(
+                    case(
+                        (
+                            and_(
+                                UserWordProgress.status == WordStatus.LEARNING,
+                                UserWordProgress.next_review.is_(None),
+                            ),
+                            1,
+                        ),
+                        else_=0,
+                    )
+                ).label("new_count"),
+                func.min(
+                    case((UserWordProgress.next_review > func.now(), UserWordProgress.next_review))
+                ).label("next_review_time"),
+            ).where(UserWordProgress.user_id == user_id)
         )
-        due_result = await db.execute(due_stmt)
-        due_count = due_result.scalar() or 0
+        row = (await db.execute(stmt)).one()
 
-        # Count new learning words (never reviewed)
-        new_stmt = select(func.count(UserWordProgress.id)).where(
-            UserWordProgress.user_id == user_id,
-            UserWordProgress.status == WordStatus.LEARNING,
-            UserWordProgress.next_review.is_(None)
-        )
-        new_result = await db.execute(new_stmt)
-        new_count = new_result.scalar() or 0
-
-        # Get next review time (earliest upcoming review)
-        next_stmt = (
-            select(func.min(UserWordProgress.next_review))
-            .where(
-                UserWordProgress.user_id == user_id,
-                UserWordProgress.next_review > func.now()
-            )
-        )
-        next_result = await db.execute(next_stmt)
-        next_review_time = next_result.scalar()
+        # SUM over zero rows is NULL
+        due_count = row.due_count or 0
+        new_count = row.new_count or 0
+        next_review_time = row.next_review_time
 
         return {
             "due_count": due_count,
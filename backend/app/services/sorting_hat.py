@@ -4,14 +4,24 @@ Sorting Hat service - Adaptive placement test using binary search algorithm.
 This service implements an intelligent placement test that determines a user's
 vocabulary level by adaptively selecting words based on their performance.
 """
+import bisect
 import random
+import time
 from typing import Optional
-from sqlalchemy import select, func
+from sqlalchemy import select, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.placement_session import PlacementSession
 from app.models.word import Word
 
+# In-process cache of word ids per unit for placement questions. Words only
+# change through admin edits and re-seeding, so a short TTL (plus explicit
+# invalidation from the admin endpoints) keeps it fresh.
+_WORD_CACHE_TTL_SECONDS = 300
+_unit_word_ids: Optional[dict[int, list[int]]] = None
+_unit_word_ids_loaded_at = 0.0
+_sorted_units: list[int] = []  # keys of _unit_word_ids, ascending
+
 
 class SortingHatService:
     """Service for managing adaptive placement tests."""
@@ -27,6 +37,37 @@ class SortingHatService:
         """Convert unit (1-10) directly to level (1-10)."""
         return min(SortingHatService.MAX_LEVEL, max(1, unit))
 
+    @staticmethod
+    def invalidate_word_cache() -> None:
+        """Drop the cached word ids so the next question reloads them."""
+        global _unit_word_ids
+        _unit_word_ids = None
+
+    @staticmethod
+    async def _get_unit_word_ids(db: AsyncSession) -> dict[int, list[int]]:
+        """Return {unit: [word_id, ...]}, loading it with one query when cold or stale."""
+        global _unit_word_ids, _unit_word_ids_loaded_at, _sorted_units
+        if _unit_word_ids is None or time.monotonic() - _unit_word_ids_loaded_at > _WORD_CACHE_TTL_SECONDS:
+            result = await db.execute(select(Word.unit, Word.id).order_by(Word.unit, Word.id))
+            ids: dict[int, list[int]] = {}
+            for unit, word_id in result:
+                ids.setdefault(unit, []).append(word_id)
+            _unit_word_ids = ids
+            _sorted_units = list(ids)  # rows came back ordered by unit
+            _unit_word_ids_loaded_at = time.monotonic()
+        return _unit_word_ids
+
+    @staticmethod
+    def _closest_unit(target: int, unit_min: int, unit_max: int) -> Optional[int]:
+        """Nearest cached unit to target within [unit_min, unit_max] (ties go to the lower unit)."""
+        i = bisect.bisect_left(_sorted_units, target)
+        candidates = [
+            unit
+            for unit in _sorted_units[max(0, i - 1):i + 1]
+            if unit_min <= unit <= unit_max
+        ]
+        return min(candidates, key=lambda unit: abs(unit - target), default=None)
+
     @staticmethod
     async def get_next_word(
         db: AsyncSession, session: PlacementSession
@@ -55,32 +96,37 @@ class SortingHatService:
             unit_min = max(1, regression_unit - 1)
             unit_max = min(regression_unit + 1, session.current_min - 1)
 
-            # Get random word from regression range
-            stmt = (
-                select(Word)
-                .where(Word.unit >= unit_min)
-                .where(Word.unit <= unit_max)
-                .order_by(func.random())
-                .limit(1)
-            )
-            result = await db.execute(stmt)
-            word = result.scalar_one_or_none()
-
-            if word:
-                return word
+            # Get random word from regression range: a random offset into the
+            # cached ids (uniform over words, like ORDER BY random())
+            unit_word_ids = await SortingHatService._get_unit_word_ids(db)
+            candidates = [
+                word_id
+                for unit in range(unit_min, unit_max + 1)
+                for word_id in unit_word_ids.get(unit, ())
+            ]
+            if candidates:
+                word = await db.get(Word, candidates[random.randrange(len(candidates))])
+                if word is not None and unit_min <= word.unit <= unit_max:
+                    return word
+                SortingHatService.invalidate_word_cache()
 
         # Normal binary search: Get word closest to midpoint unit
         mid = (session.current_min + session.current_max) // 2
 
-        # Try to find word at exact midpoint unit first
-        stmt = select(Word).where(Word.unit == mid).order_by(func.random()).limit(1)
-        result = await db.execute(stmt)
-        word = result.scalar_one_or_none()
+        # Pick a random word from the midpoint unit, or else from the closest
+        # populated unit in range (bisect over the cached, sorted units)
+        unit_word_ids = await SortingHatService._get_unit_word_ids(db)
+        unit = SortingHatService._closest_unit(mid, session.current_min, session.current_max)
+        if unit is None:
+            return None
 
-        if word:
+        word = await db.get(Word, random.choice(unit_word_ids[unit]))
+        if word is not None and word.unit == unit:
             return word
 
-        # If no word at exact midpoint, find closest word in range
+        # Cached id was deleted or moved; reload on the next question and
+        # answer this one from the database
+        SortingHatService.invalidate_word_cache()
         stmt = (
             select(Word)
             .where(Word.unit >= session.current_min)
@@ -89,13 +135,11 @@ class SortingHatService:
             .limit(1)
         )
         result = await db.execute(stmt)
-        word = result.scalar_one_or_none()
-
-        return word
+        return result.scalar_one_or_none()
 
     @staticmethod
     async def submit_answer(
-        db: AsyncSession, session: PlacementSession, is_known: bool
+        db: AsyncSession, session: PlacementSession, is_known: bool, commit: bool = True
     ) -> tuple[PlacementSession, bool]:
         """
         Submit an answer and update the placement session using binary search logic.
@@ -104,6 +148,8 @@ class SortingHatService:
             db: Database session.
             session: PlacementSession instance.
             is_known: True if user knew the word, False otherwise.
+            commit: Commit and refresh (default). If False, only flush — the
+                caller commits, e.g. to apply many answers in one transaction.
 
         Returns:
             Tuple of (updated_session, is_complete).
@@ -134,18 +180,22 @@ class SortingHatService:
             final_unit = (session.current_min + session.current_max) // 2
             session.final_level = SortingHatService.unit_to_level(final_unit)
 
-            # Update the user's level in the database
+            # Update the user's level in the database (single UPDATE, no SELECT;
+            # the default "evaluate" sync keeps an already-loaded User current)
             from app.models.user import User
-            stmt = select(User).where(User.id == session.user_id)
-            result = await db.execute(stmt)
-            user = result.scalar_one_or_none()
-            if user:
-                user.level = session.final_level
+            await db.execute(
+                update(User)
+                .where(User.id == session.user_id)
+                .values(level=session.final_level)
+            )
 
         # Persist changes
         db.add(session)
-        await db.commit()
-        await db.refresh(session)
+        if commit:
+            await db.commit()
+            await db.refresh(session)
+        else:
+            await db.flush()
 
         return session, is_complete
 
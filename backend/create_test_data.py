@@ -1,5 +1,6 @@
 """Quick script to create test data for API testing."""
 import asyncio
+from sqlalchemy import insert
 from app.db.session import engine, Base, AsyncSessionLocal
 from app.models import User, Word
 
@@ -19,23 +20,19 @@ async def create_test_data():
         await session.flush()
         print(f"[OK] Created user: ID={user.id}, Email={user.email}")
 
-        # Create 100 words with different difficulties
-        words = []
-        for rank in range(1, 101):
-            word = Word(
-                english=f"Word_{rank}",
-                hebrew=f"מילה_{rank}",
-                difficulty_rank=rank,
-            )
-            words.append(word)
-
-        session.add_all(words)
+        # Create 100 words across units 1-10 (one multi-row INSERT)
+        words = [
+            {"english": f"Word_u{unit}_{i}", "hebrew": f"מילה_{unit}_{i}", "unit": unit}
+            for unit in range(1, 11)
+            for i in range(1, 11)
+        ]
+        await session.execute(insert(Word), words)
         await session.commit()
-        print(f"[OK] Created {len(words)} words (difficulty 1-100)")
+        print(f"[OK] Created {len(words)} words (10 per unit, units 1-10)")
 
     print("\n[SUCCESS] Test data ready!")
     print("User ID: 1")
-    print("Words: 100 (difficulty 1-100)")
+    print("Words: 100 (10 per unit, units 1-10)")
 
 if __name__ == "__main__":
     asyncio.run(create_test_data())
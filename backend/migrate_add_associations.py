@@ -26,21 +26,21 @@ async def migrate():
     print()
 
     async with engine.begin() as conn:
-        # Check if columns already exist
+        # Check which columns already exist (one PRAGMA, checked as a set)
         result = await conn.execute(text("PRAGMA table_info(words)"))
-        columns = [row[1] for row in result]
+        columns = {row[1] for row in result}
+        missing = [name for name in ("ai_association", "user_association") if name not in columns]
 
-        if 'ai_association' in columns and 'user_association' in columns:
+        if not missing:
             print("✅ Columns already exist. No migration needed.")
             return
 
-        print("[INFO] Adding ai_association column...")
-        await conn.execute(text("ALTER TABLE words ADD COLUMN ai_association VARCHAR(1000)"))
-        print("✅ Added ai_association")
-
-        print("[INFO] Adding user_association column...")
-        await conn.execute(text("ALTER TABLE words ADD COLUMN user_association VARCHAR(1000)"))
-        print("✅ Added user_association")
+        # The sqlite driver opens no transaction for DDL, so each ALTER commits
+        # on its own; a re-run adds whichever column is still missing
+        for name in missing:
+            print(f"[INFO] Adding {name} column...")
+            await conn.execute(text(f"ALTER TABLE words ADD COLUMN {name} VARCHAR(1000)"))
+            print(f"✅ Added {name}")
 
     # Verify word count
     async with AsyncSessionLocal() as session:
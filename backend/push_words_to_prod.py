@@ -62,7 +62,8 @@ def main():
     print("Backing up user progress from production...")
     prod_cur.execute("""
         SELECT uwp.user_id, w.english, w.language,
-               uwp.status, uwp.next_review, uwp.srs_data
+               uwp.status, uwp.next_review,
+               uwp.repetition_number, uwp.easiness_factor, uwp.interval_days
         FROM user_word_progress uwp
         JOIN words w ON w.id = uwp.word_id
     """)
@@ -93,20 +94,21 @@ def main():
 
     # Step 5: Re-insert progress with remapped word IDs
     print("Restoring user progress with remapped word IDs...")
-    from psycopg2.extras import execute_values, Json
+    from psycopg2.extras import execute_values
     progress_rows = []
     skipped = 0
-    for user_id, english, language, status, next_review, srs_data in progress_backup:
+    for user_id, english, language, status, next_review, *sm2 in progress_backup:
         new_word_id = word_lookup.get((english, language))
         if new_word_id is None:
             skipped += 1
             continue
-        progress_rows.append((user_id, new_word_id, status, next_review, Json(srs_data) if srs_data is not None else None))
+        progress_rows.append((user_id, new_word_id, status, next_review, *sm2))
 
     if progress_rows:
         execute_values(
             prod_cur,
-            "INSERT INTO user_word_progress (user_id, word_id, status, next_review, srs_data) VALUES %s",
+            "INSERT INTO user_word_progress "
+            "(user_id, word_id, status, next_review, repetition_number, easiness_factor, interval_days) VALUES %s",
             progress_rows,
             page_size=500,
         )
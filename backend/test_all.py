@@ -0,0 +1,45 @@
+"""
+Run the database test scripts back to back on one engine.
+
+test_db.py and test_sorting_hat.py each reset the tables they use, so they
+run sequentially (they share a schema), but in one process and event loop:
+the connection pool stays warm between them and is disposed once at the end.
+
+    cd backend
+    python test_all.py
+"""
+import asyncio
+import sys
+
+from test_db import test_database_setup, engine
+from test_sorting_hat import test_sorting_hat
+
+
+async def run_all() -> None:
+    """Run every test script, then close the shared engine."""
+    try:
+        await test_database_setup(dispose_engine=False)
+        await test_sorting_hat(dispose_engine=False)
+    finally:
+        print("\n[Cleanup] Closing database connection...")
+        await engine.dispose()
+        print("[OK] Database connection closed")
+
+
+def main() -> None:
+    """Main entry point."""
+    try:
+        # Same event loop choice as the individual scripts
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+        asyncio.run(run_all())
+    except KeyboardInterrupt:
+        print("\n\n[WARNING] Test run interrupted by user")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
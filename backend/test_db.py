@@ -5,6 +5,7 @@ Run this to ensure everything is configured correctly.
 import asyncio
 import sys
 import os
+import traceback
 from datetime import datetime, timedelta
 
 # Fix Windows encoding for Unicode characters
@@ -15,13 +16,16 @@ if sys.platform == 'win32':
         import codecs
         sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
 
+# Reuse pooled SQLite connections across the test steps (ignored on PostgreSQL)
+os.environ.setdefault("SQLITE_POOL_SIZE", "8")
+
 print("=" * 60)
 print("DATABASE SETUP TEST")
 print("=" * 60)
 
 try:
     print("\n[1/6] Importing database modules...")
-    from app.db.session import engine, Base, AsyncSessionLocal
+    from app.db.session import engine, Base, AsyncSessionLocal, DIALECT
     print("[OK] Database modules imported successfully")
 except ImportError as e:
     print(f"[ERROR] Failed to import database modules: {e}")
@@ -33,47 +37,75 @@ except ImportError as e:
 try:
     print("\n[2/6] Importing models...")
     from app.models import User, Word, Association, UserWordProgress, WordStatus
-    from sqlalchemy import func
+    from sqlalchemy import bindparam, event, func, select, text
     print("[OK] Models imported successfully")
 except ImportError as e:
     print(f"[ERROR] Failed to import models: {e}")
     sys.exit(1)
 
 
-async def test_database_setup() -> None:
+if DIALECT == "sqlite":
+    # Throwaway test data: skip fsync and keep the rollback journal in memory
+    @event.listens_for(engine.sync_engine, "connect")
+    def _fast_sqlite_pragmas(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+
+# Fixture baseline, naive UTC like the app's next_review values (datetime.utcnow())
+_NOW = datetime.utcnow()
+
+# Relationship counts for one user and one word, built once at import and
+# reused with bound :uid/:wid values (one SELECT of four scalar subqueries)
+_RELATIONSHIP_COUNTS = select(
+    select(func.count()).select_from(UserWordProgress)
+    .where(UserWordProgress.user_id == bindparam("uid")).scalar_subquery(),
+    select(func.count()).select_from(Association)
+    .where(Association.user_id == bindparam("uid")).scalar_subquery(),
+    select(func.count()).select_from(Association)
+    .where(Association.word_id == bindparam("wid")).scalar_subquery(),
+    select(func.count()).select_from(UserWordProgress)
+    .where(UserWordProgress.word_id == bindparam("wid")).scalar_subquery(),
+)
+
+
+async def test_database_setup(dispose_engine: bool = True) -> None:
     """Test database creation and basic CRUD operations."""
 
     try:
         # Step 1: Create tables
         print("\n[3/6] Creating database tables...")
         async with engine.begin() as conn:
-            # Drop existing tables (for clean test)
-            await conn.run_sync(Base.metadata.drop_all)
-            print("  - Dropped existing tables (if any)")
-
-            # Create all tables
+            # Create any missing tables, then empty them all (for clean test);
+            # cheaper than dropping and re-creating the schema on every run
             await conn.run_sync(Base.metadata.create_all)
             print("  - Created tables: users, words, associations, user_word_progress")
+            tables = Base.metadata.sorted_tables
+            if DIALECT == "postgresql":
+                names = ", ".join(table.name for table in tables)
+                await conn.execute(text(f"TRUNCATE {names} RESTART IDENTITY CASCADE"))
+            else:
+                for table in reversed(tables):
+                    await conn.execute(table.delete())
+            print("  - Cleared existing rows (if any)")
         print("[OK] Tables created successfully")
 
         # Step 2: Insert test data
         print("\n[4/6] Inserting test data...")
         async with AsyncSessionLocal() as session:
             try:
-                # Create a test user
-                print("  - Creating test user...")
+                # Build the whole object graph first, linked through relationships,
+                # so a single commit flushes every INSERT (no per-object flush)
+                print("  - Creating test user, words, association and progress...")
                 user = User(
                     email="test@example.com",
                     hashed_password="$2b$12$hashed_password_placeholder",
                     xp=100,
                     level=2,
                 )
-                session.add(user)
-                await session.flush()
-                print(f"    [OK] User created: ID={user.id}, Email={user.email}")
-
-                # Create test words
-                print("  - Creating test words...")
                 word1 = Word(
                     english="Hello",
                     hebrew="שלום",
@@ -85,67 +117,41 @@ async def test_database_setup() -> None:
                     hebrew="להתראות",
                     unit=1,
                 )
-                session.add_all([word1, word2])
-                await session.flush()
-                print(f"    [OK] Word 1: ID={word1.id}, {word1.english} = {word1.hebrew}")
-                print(f"    [OK] Word 2: ID={word2.id}, {word2.english} = {word2.hebrew}")
-
-                # Create association
-                print("  - Creating memory association...")
                 association = Association(
-                    word_id=word1.id,
-                    user_id=user.id,
+                    word=word1,
+                    user=user,
                     text="Remember: Shalom sounds like 'so long'!",
                     likes=5,
                 )
-                session.add(association)
-                await session.flush()
-                print(f"    [OK] Association created: ID={association.id}, Likes={association.likes}")
-
-                # Create user progress
-                print("  - Creating progress record...")
                 progress = UserWordProgress(
-                    user_id=user.id,
-                    word_id=word1.id,
+                    user=user,
+                    word=word1,
                     status=WordStatus.LEARNING,
-                    next_review=datetime.now() + timedelta(days=1),
-                    srs_data={
-                        "repetition_number": 2,
-                        "easiness_factor": 2.4,
-                        "interval_days": 1,
-                    },
+                    next_review=_NOW + timedelta(days=1),
+                    repetition_number=2,
+                    easiness_factor=2.4,
+                    interval_days=1,
                 )
-                session.add(progress)
+                session.add_all([user, word1, word2, association, progress])
                 await session.commit()
+                print(f"    [OK] User created: ID={user.id}, Email={user.email}")
+                print(f"    [OK] Word 1: ID={word1.id}, {word1.english} = {word1.hebrew}")
+                print(f"    [OK] Word 2: ID={word2.id}, {word2.english} = {word2.hebrew}")
+                print(f"    [OK] Association created: ID={association.id}, Likes={association.likes}")
                 print(f"    [OK] Progress: ID={progress.id}, Status={progress.status.value}")
                 print("[OK] Test data inserted successfully")
 
                 # Step 3: Test relationships (using explicit queries)
                 print("\n[5/6] Testing model relationships...")
-                from sqlalchemy import select
 
-                # Count user's progress records
-                progress_count = await session.scalar(
-                    select(func.count()).select_from(UserWordProgress).where(UserWordProgress.user_id == user.id)
-                )
+                # All four counts in one round-trip
+                counts = (await session.execute(
+                    _RELATIONSHIP_COUNTS, {"uid": user.id, "wid": word1.id}
+                )).one()
+                progress_count, assoc_count, word_assoc_count, word_progress_count = counts
                 print(f"  - User has {progress_count} progress record(s)")
-
-                # Count user's associations
-                assoc_count = await session.scalar(
-                    select(func.count()).select_from(Association).where(Association.user_id == user.id)
-                )
                 print(f"  - User has {assoc_count} association(s)")
-
-                # Count word's associations
-                word_assoc_count = await session.scalar(
-                    select(func.count()).select_from(Association).where(Association.word_id == word1.id)
-                )
                 print(f"  - Word '{word1.english}' has {word_assoc_count} association(s)")
-
-                # Count word's progress records
-                word_progress_count = await session.scalar(
-                    select(func.count()).select_from(UserWordProgress).where(UserWordProgress.word_id == word1.id)
-                )
                 print(f"  - Word '{word1.english}' has {word_progress_count} progress record(s)")
                 print("[OK] Relationships working correctly")
 
@@ -154,27 +160,23 @@ async def test_database_setup() -> None:
                 await session.rollback()
                 raise
 
-        # Step 4: Verify data persistence
-        print("\n[6/6] Verifying data persistence...")
-        async with AsyncSessionLocal() as session:
-            from sqlalchemy import select
-
-            result = await session.execute(select(User))
-            users = result.scalars().all()
-            print(f"  - Found {len(users)} user(s) in database")
-
-            result = await session.execute(select(Word))
-            words = result.scalars().all()
-            print(f"  - Found {len(words)} word(s) in database")
-
-            result = await session.execute(select(Association))
-            associations = result.scalars().all()
-            print(f"  - Found {len(associations)} association(s) in database")
-
-            result = await session.execute(select(UserWordProgress))
-            progress_records = result.scalars().all()
-            print(f"  - Found {len(progress_records)} progress record(s) in database")
-        print("[OK] Data persistence verified")
+            # Step 4: Verify data persistence (same session and connection;
+            # everything above was committed, so these SELECTs read it back)
+            print("\n[6/6] Verifying data persistence...")
+            # Row counts for all four tables in one round-trip
+            user_total, word_total, association_total, progress_total = (await session.execute(
+                select(
+                    select(func.count()).select_from(User).scalar_subquery(),
+                    select(func.count()).select_from(Word).scalar_subquery(),
+                    select(func.count()).select_from(Association).scalar_subquery(),
+                    select(func.count()).select_from(UserWordProgress).scalar_subquery(),
+                )
+            )).one()
+            print(f"  - Found {user_total} user(s) in database")
+            print(f"  - Found {word_total} word(s) in database")
+            print(f"  - Found {association_total} association(s) in database")
+            print(f"  - Found {progress_total} progress record(s) in database")
+            print("[OK] Data persistence verified")
 
         # Success message
         print("\n" + "=" * 60)
@@ -191,20 +193,27 @@ async def test_database_setup() -> None:
         print("[ERROR] TEST FAILED")
         print("=" * 60)
         print(f"\nError: {e}")
-        import traceback
         print("\nFull traceback:")
         traceback.print_exc()
         sys.exit(1)
     finally:
-        # Cleanup
-        print("\n[Cleanup] Closing database connection...")
-        await engine.dispose()
-        print("[OK] Database connection closed")
+        # Cleanup (skipped when test_all.py runs several scripts on one engine)
+        if dispose_engine:
+            print("\n[Cleanup] Closing database connection...")
+            await engine.dispose()
+            print("[OK] Database connection closed")
 
 
 def main() -> None:
     """Main entry point."""
     try:
+        # uvloop (installed with uvicorn[standard] on Linux/macOS) has cheaper
+        # await scheduling; fall back to the default loop elsewhere (Windows)
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
         asyncio.run(test_database_setup())
     except KeyboardInterrupt:
         print("\n\n[WARNING] Test interrupted by user")
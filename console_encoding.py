@@ -0,0 +1,15 @@
+"""
+Console helpers shared by the root-level data scripts.
+"""
+import sys
+
+
+def ensure_utf8_stdout():
+    """Fix Windows console encoding so Hebrew and emoji output doesn't crash"""
+    if sys.platform != 'win32':
+        return
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except AttributeError:
+        import codecs
+        sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
@@ -7,36 +7,46 @@ STRICT requirements:
 - Perfect difficulty distribution
 """
 import sys
+import os
+import json
+import hashlib
 import csv
-
-# Fix Windows encoding
-if sys.platform == 'win32':
-    try:
-        sys.stdout.reconfigure(encoding='utf-8')
-    except AttributeError:
-        import codecs
-        sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
-
-# Read all authentic words from CSV
+from collections import Counter
+from itertools import chain
+
+from console_encoding import ensure_utf8_stdout
+from seed_output import OUTPUT_PATH, write_seed_words
+
+ensure_utf8_stdout()
+
+SOURCE_PATH = 'psychometric_words_clean.txt'
+
+# Skip regeneration when neither the word list nor this generator changed
+# (the seed generators write the same file, so the hash covers the script too)
+source_hash = hashlib.sha256()
+for path in (SOURCE_PATH, __file__):
+    with open(path, 'rb') as f:
+        source_hash.update(f.read())
+source_sha256 = source_hash.hexdigest()
+if os.path.exists(OUTPUT_PATH):
+    with open(OUTPUT_PATH, 'r', encoding='utf-8') as f:
+        if json.load(f).get('source_sha256') == source_sha256:
+            print(f"✅ {OUTPUT_PATH} is up to date, skipping regeneration")
+            sys.exit(0)
+
+# Read all authentic words from CSV as (english, hebrew, english_lc) tuples
 all_words = []
-with open('psychometric_words_clean.txt', 'r', encoding='utf-8') as f:
-    for line in f:
-        line = line.strip()
-        if line:
-            parts = line.split('\t')
-            if len(parts) == 2:
-                english = parts[0].strip()
-                hebrew = parts[1].strip()
-
-                # Filter: only single words or common phrases (no long phrases)
-                # Only words 3-15 characters (avoid very short or very long)
-                if english and hebrew and 3 <= len(english) <= 15:
-                    # Skip phrases with multiple spaces or numbers
-                    if english.count(' ') <= 1 and not any(char.isdigit() for char in english):
-                        all_words.append({
-                            'english': english,
-                            'hebrew': hebrew
-                        })
+with open(SOURCE_PATH, 'r', encoding='utf-8', newline='') as f:
+    for row in csv.reader(f, delimiter='\t', quoting=csv.QUOTE_NONE):
+        if len(row) == 2:
+            english, hebrew = row[0].strip(), row[1].strip()
+
+            # Filter: only single words or common phrases (no long phrases)
+            # Only words 3-15 characters (avoid very short or very long)
+            if english and hebrew and 3 <= len(english) <= 15:
+                # Skip phrases with multiple spaces or numbers
+                if english.count(' ') <= 1 and not any(char.isdigit() for char in english):
+                    all_words.append((english, hebrew, english.lower()))
 
 print(f"Loaded {len(all_words)} valid psychometric words")
 
@@ -45,7 +55,7 @@ print(f"Loaded {len(all_words)} valid psychometric words")
 
 # TIER 1 (Levels 1-4): Most Common Words - 80 words needed
 tier1_words = []
-basic_words = [
+basic_words = frozenset(w.lower() for w in [
     'able', 'about', 'above', 'accept', 'access', 'account', 'achieve', 'across',
     'actual', 'adapt', 'add', 'address', 'adjust', 'admit', 'adopt', 'advance',
     'advice', 'affect', 'afford', 'after', 'against', 'agree', 'allow', 'also',
@@ -56,11 +66,11 @@ basic_words = [
     'basic', 'become', 'before', 'begin', 'behalf', 'behave', 'believe', 'benefit',
     'between', 'beyond', 'both', 'brief', 'build', 'capable', 'capacity', 'cause',
     'central', 'certain', 'challenge', 'change', 'chapter', 'choice', 'choose', 'cite'
-]
+])
 
 # TIER 2 (Levels 5-8): Common Academic - 80 words needed
 tier2_words = []
-common_academic = [
+common_academic = frozenset(w.lower() for w in [
     'circumstance', 'civil', 'clarify', 'classic', 'clause', 'clear', 'coherent', 'coincide',
     'collapse', 'colleague', 'commence', 'comment', 'commit', 'common', 'communicate', 'community',
     'compatible', 'compensate', 'compile', 'complement', 'complete', 'complex', 'component', 'compound',
@@ -71,11 +81,11 @@ common_academic = [
     'controversy', 'convene', 'convention', 'convert', 'convince', 'cooperate', 'coordinate', 'core',
     'corporate', 'correspond', 'couple', 'create', 'credit', 'criteria', 'critical', 'crucial',
     'culture', 'cumulative', 'currency', 'cycle', 'data', 'debate', 'decade', 'decline'
-]
+])
 
 # TIER 3 (Levels 9-12): Intermediate Academic - 80 words needed
 tier3_words = []
-intermediate = [
+intermediate = frozenset(w.lower() for w in [
     'deduce', 'define', 'definite', 'demonstrate', 'denote', 'deny', 'depress', 'derive',
     'design', 'despite', 'detect', 'deviate', 'device', 'devise', 'differentiate', 'dimension',
     'diminish', 'discrete', 'discriminate', 'displace', 'display', 'dispose', 'distinct', 'distort',
@@ -86,11 +96,11 @@ intermediate = [
     'estate', 'estimate', 'ethic', 'ethnic', 'evaluate', 'eventual', 'evident', 'evolve',
     'exceed', 'exclude', 'exhibit', 'expand', 'expert', 'explicit', 'exploit', 'export',
     'expose', 'external', 'extract', 'facilitate', 'factor', 'feature', 'federal', 'file'
-]
+])
 
 # TIER 4 (Levels 13-16): Advanced Academic - 80 words needed
 tier4_words = []
-advanced = [
+advanced = frozenset(w.lower() for w in [
     'final', 'finance', 'finite', 'flexible', 'fluctuate', 'focus', 'format', 'formula',
     'forthcoming', 'foundation', 'founded', 'framework', 'function', 'fund', 'fundamental', 'furthermore',
     'gender', 'generate', 'generation', 'globe', 'goal', 'grade', 'grant', 'guarantee',
@@ -101,11 +111,11 @@ advanced = [
     'initial', 'initiate', 'injure', 'innovate', 'input', 'insert', 'insight', 'inspect',
     'instance', 'institute', 'instruct', 'integral', 'integrate', 'integrity', 'intelligence', 'intense',
     'interact', 'intermediate', 'internal', 'interpret', 'interval', 'intervene', 'intrinsic', 'invest'
-]
+])
 
 # TIER 5 (Levels 17-20): Expert/Rare - 80 words needed
 tier5_words = []
-expert = [
+expert = frozenset(w.lower() for w in [
     'investigate', 'invoke', 'involve', 'isolate', 'issue', 'item', 'job', 'journal',
     'justify', 'label', 'labor', 'layer', 'lecture', 'legal', 'legislate', 'levy',
     'liberal', 'license', 'likewise', 'link', 'locate', 'logic', 'maintain', 'major',
@@ -116,16 +126,18 @@ expert = [
     'notwithstanding', 'nuclear', 'objective', 'obtain', 'obvious', 'occupy', 'occur', 'odd',
     'offset', 'ongoing', 'option', 'orient', 'outcome', 'output', 'overall', 'overlap',
     'overseas', 'panel', 'paradigm', 'paragraph', 'parallel', 'parameter', 'participate', 'partner'
-]
+])
 
 # Match tier words with actual words from CSV
-def find_matching_words(tier_list, all_words_list, needed_count):
-    """Find words from all_words that match the tier list"""
+def find_matching_words(tier_set, all_words_list, needed_count):
+    """Find words from all_words that match the tier set"""
     matched = []
-    tier_set = set(w.lower() for w in tier_list)
+    seen_keys = set()
 
     for word in all_words_list:
-        if word['english'].lower() in tier_set and word not in matched:
+        key = word[2]
+        if key in tier_set and key not in seen_keys:
+            seen_keys.add(key)
             matched.append(word)
             if len(matched) >= needed_count:
                 break
@@ -182,8 +194,8 @@ for tier_idx, tier in enumerate(all_tiers):
             # Ranks: 1-5, 6-10, 11-15, ..., 96-100
             rank = rank_min + (i % 5)
             final_words.append({
-                'english': word['english'],
-                'hebrew': word['hebrew'],
+                'english': word[0],
+                'hebrew': word[1],
                 'rank': rank,
                 'level': level_num
             })
@@ -191,10 +203,7 @@ for tier_idx, tier in enumerate(all_tiers):
 print(f"\n✅ Final selection: {len(final_words)} words")
 
 # Verify distribution
-level_counts = {}
-for word in final_words:
-    level = word['level']
-    level_counts[level] = level_counts.get(level, 0) + 1
+level_counts = Counter(word['level'] for word in final_words)
 
 print("\n📊 Distribution verification:")
 for level in range(1, 21):
@@ -208,147 +217,23 @@ if len(final_words) != 400:
     # Fill with remaining words if needed
     remaining_needed = 400 - len(final_words)
     if remaining_needed > 0:
-        unused_words = [w for w in all_words if w not in [fw for fw in tier1_matched + tier2_matched + tier3_matched + tier4_matched + tier5_matched]]
-        for i in range(remaining_needed):
-            if i < len(unused_words):
-                # Add to last level
-                rank = 96 + (i % 5)
-                final_words.append({
-                    'english': unused_words[i]['english'],
-                    'hebrew': unused_words[i]['hebrew'],
-                    'rank': rank,
-                    'level': 20
-                })
+        used_ids = {id(w) for w in chain(tier1_matched, tier2_matched, tier3_matched, tier4_matched, tier5_matched)}
+        unused_words = [w for w in all_words if id(w) not in used_ids][:remaining_needed]
+        # Add to last level
+        final_words.extend(
+            {'english': english, 'hebrew': hebrew, 'rank': 96 + (i % 5), 'level': 20}
+            for i, (english, hebrew, _) in enumerate(unused_words)
+        )
 
 # Sort by rank
 final_words.sort(key=lambda w: w['rank'])
 
 print(f"\n✅ FINAL: {len(final_words)} words ready for seeding")
 
-# Generate seed file
-output = '''"""
-Seed script for Israeli Psychometric Entrance Test vocabulary.
-STRICT CURATED VERSION:
-- EXACTLY 400 authentic psychometric words
-- EXACTLY 20 words per level across 20 levels
-- Hebrew translations from authentic test prep materials
-- Difficulty based on Academic Word List and psychometric standards
-"""
-import asyncio
-import sys
-from sqlalchemy import select, delete
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from app.db.session import engine, AsyncSessionLocal, Base
-from app.models.word import Word
-
-
-# 400 AUTHENTIC Israeli Psychometric Test words
-# PERFECT distribution: 20 levels × 20 words = 400
-# Level = ceil(difficulty_rank / 5)
-PSYCHOMETRIC_WORDS = [
-'''
-
-current_level = 0
-for word in final_words:
-    level = word['level']
-    rank = word['rank']
-
-    if level != current_level:
-        output += f'\n    # ===== LEVEL {level} (ranks {((level-1)*5)+1}-{level*5}) - EXACTLY 20 WORDS =====\n'
-        current_level = level
-
-    output += f'    {{"english": "{word["english"]}", "hebrew": "{word["hebrew"]}", "difficulty_rank": {rank}}},\n'
-
-output += ''']
-
-
-async def seed_words(session: AsyncSession):
-    """Seed database with EXACTLY 400 authentic psychometric words."""
-    print("\\n" + "=" * 70)
-    print("🇮🇱 STRICT PSYCHOMETRIC VOCABULARY SEEDER 🇮🇱")
-    print("=" * 70)
-
-    # Clear existing words
-    print("[INFO] Clearing existing words...")
-    await session.execute(delete(Word))
-    await session.commit()
-    print("[CLEARED] Database wiped clean.")
-
-    # Insert words
-    print(f"[SEEDING] Inserting {len(PSYCHOMETRIC_WORDS)} authentic words...")
-    for word_data in PSYCHOMETRIC_WORDS:
-        word = Word(
-            english=word_data["english"],
-            hebrew=word_data["hebrew"],
-            difficulty_rank=word_data["difficulty_rank"]
-        )
-        session.add(word)
-
-    await session.commit()
-    print(f"[SUCCESS] ✅ Inserted {len(PSYCHOMETRIC_WORDS)} words")
-
-    # Verify
-    stmt = select(Word)
-    result = await session.execute(stmt)
-    total = len(result.scalars().all())
-    print(f"[VERIFY] Total in database: {total}")
-
-    if total != 400:
-        print(f"[ERROR] ❌ Expected 400, found {total}")
-    else:
-        print("[VERIFY] ✅ Perfect count: 400 words")
-
-    # Verify distribution
-    print("\\n[DISTRIBUTION] Verifying 20 words per level:")
-    all_good = True
-    for level in range(1, 21):
-        min_rank = (level - 1) * 5 + 1
-        max_rank = level * 5
-        stmt = select(Word).where(
-            Word.difficulty_rank >= min_rank,
-            Word.difficulty_rank <= max_rank
-        )
-        result = await session.execute(stmt)
-        count = len(result.scalars().all())
-        status = "✅" if count == 20 else "❌"
-        print(f"  Level {level:2d} (ranks {min_rank:2d}-{max_rank:3d}): {count:2d} words {status}")
-        if count != 20:
-            all_good = False
-
-    if all_good:
-        print("\\n[SUCCESS] ✅ PERFECT distribution: 20 words × 20 levels = 400")
-    else:
-        print("\\n[ERROR] ❌ Distribution not perfect")
-
-
-async def main():
-    """Main seeder function."""
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-    async with AsyncSessionLocal() as session:
-        await seed_words(session)
-
-    print("\\n" + "=" * 70)
-    print("✅ SEEDING COMPLETE")
-    print("=" * 70)
-
-
-if __name__ == "__main__":
-    if sys.platform == 'win32':
-        try:
-            sys.stdout.reconfigure(encoding='utf-8')
-        except AttributeError:
-            import codecs
-            sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
-
-    asyncio.run(main())
-'''
-
-with open('backend/app/seed_psychometric_data.py', 'w', encoding='utf-8') as f:
-    f.write(output)
+# Write the selection in database_english.json's unit layout for the backend seeder
+write_seed_words(final_words, source_sha256)
 
-print(f"\n✅ Seed file created: backend/app/seed_psychometric_data.py")
+print(f"\n✅ Seed words written: {OUTPUT_PATH}")
 print(f"📊 EXACT distribution: 20 levels × 20 words = 400 total")
 print(f"🎯 Ready to seed database with perfect data")
+print("Seed it: cd backend && python -m app.seed_psychometric_data ../seed_psychometric_words.json")
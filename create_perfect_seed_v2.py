@@ -3,18 +3,37 @@ Create PERFECT seed with EXACTLY 400 words using ALL authentic psychometric voca
 Uses sophisticated difficulty scoring on actual CSV data.
 """
 import sys
+import os
+import json
+import hashlib
 import re
+import csv
+from collections import Counter
 
-# Fix Windows encoding
-if sys.platform == 'win32':
-    try:
-        sys.stdout.reconfigure(encoding='utf-8')
-    except AttributeError:
-        import codecs
-        sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
+import numpy as np
+
+from console_encoding import ensure_utf8_stdout
+from seed_output import OUTPUT_PATH, write_seed_words
+
+ensure_utf8_stdout()
+
+SOURCE_PATH = 'psychometric_words_clean.txt'
+
+# Skip regeneration when neither the word list nor this generator changed
+# (the seed generators write the same file, so the hash covers the script too)
+source_hash = hashlib.sha256()
+for path in (SOURCE_PATH, __file__):
+    with open(path, 'rb') as f:
+        source_hash.update(f.read())
+source_sha256 = source_hash.hexdigest()
+if os.path.exists(OUTPUT_PATH):
+    with open(OUTPUT_PATH, 'r', encoding='utf-8') as f:
+        if json.load(f).get('source_sha256') == source_sha256:
+            print(f"✅ {OUTPUT_PATH} is up to date, skipping regeneration")
+            sys.exit(0)
 
 # Most common English words (should be easiest)
-COMMON_WORDS = {
+COMMON_WORDS = frozenset({
     'about', 'above', 'accept', 'across', 'add', 'admit', 'affect', 'after', 'against',
     'agree', 'allow', 'also', 'among', 'another', 'answer', 'appear', 'apply', 'approach',
     'area', 'around', 'ask', 'attack', 'attempt', 'avoid', 'back', 'become', 'before',
@@ -61,105 +80,84 @@ COMMON_WORDS = {
     'whose', 'wide', 'wife', 'will', 'window', 'within', 'without', 'woman', 'wonder',
     'word', 'work', 'worker', 'world', 'worry', 'would', 'write', 'writer', 'wrong',
     'yard', 'year', 'young', 'your', 'yourself'
-}
-
-def calculate_difficulty(english_word):
-    """Calculate difficulty score (0-100)"""
-    word = english_word.lower().strip()
-    score = 0
-
-    # Word length (primary factor)
-    length = len(word)
-    if length <= 4:
-        score += 0
-    elif length <= 5:
-        score += 10
-    elif length <= 6:
-        score += 20
-    elif length <= 7:
-        score += 30
-    elif length <= 8:
-        score += 40
-    elif length <= 9:
-        score += 50
-    elif length <= 10:
-        score += 60
-    elif length <= 11:
-        score += 70
-    elif length <= 12:
-        score += 80
-    else:
-        score += 90
+})
+
+# Advanced suffixes/prefixes and letters that push a word's difficulty up
+ADVANCED_SUFFIXES = ('tion', 'sion', 'ment', 'ness', 'ance', 'ence', 'ity', 'ism', 'ous', 'ious', 'eous', 'ive')
+ADVANCED_PREFIXES = ('pre', 'post', 'anti', 'contra', 'inter', 'trans', 'sub', 'super', 'ultra', 'pseudo')
+UNCOMMON_LETTERS = ('q', 'x', 'z', 'j')
+_VOWEL_RE = re.compile(r'[aeiou]+')
+
+
+def calculate_difficulty(words, lengths):
+    """Calculate difficulty scores (0-100) for lowercased, stripped words and their lengths"""
+    n = len(words)
+
+    # Word length (primary factor): <=4 letters scores 0, +10 per letter, capped at 90
+    score = np.clip((np.asarray(lengths, dtype=np.int16) - 4) * 10, 0, 90).astype(np.int16)
 
     # Common word penalty (make very common words easiest)
-    if word in COMMON_WORDS:
-        score = max(0, score - 30)
+    common = np.fromiter((w in COMMON_WORDS for w in words), dtype=bool, count=n)
+    score -= np.where(common, 30, 0).astype(np.int16)
+    np.maximum(score, 0, out=score)
 
     # Advanced suffixes
-    advanced_suffixes = ['tion', 'sion', 'ment', 'ness', 'ance', 'ence', 'ity', 'ism', 'ous', 'ious', 'eous', 'ive']
-    for suffix in advanced_suffixes:
-        if word.endswith(suffix):
-            score += 15
-            break
-
-    # Advanced prefixes
-    advanced_prefixes = ['pre', 'post', 'anti', 'contra', 'inter', 'trans', 'sub', 'super', 'ultra', 'pseudo']
-    for prefix in advanced_prefixes:
-        if word.startswith(prefix) and len(word) > len(prefix) + 2:
-            score += 10
-            break
+    score += 15 * np.fromiter((w.endswith(ADVANCED_SUFFIXES) for w in words), dtype=np.int16, count=n)
+
+    # Advanced prefixes (one startswith over the whole tuple rejects most words)
+    score += 10 * np.fromiter(
+        (w.startswith(ADVANCED_PREFIXES)
+         and any(w.startswith(p) and len(w) > len(p) + 2 for p in ADVANCED_PREFIXES) for w in words),
+        dtype=np.int16, count=n,
+    )
 
     # Uncommon letters
-    uncommon = ['q', 'x', 'z', 'j']
-    for letter in uncommon:
-        if letter in word:
-            score += 5
+    score += 5 * np.fromiter(
+        (sum(letter in w for letter in UNCOMMON_LETTERS) for w in words),
+        dtype=np.int16, count=n,
+    )
 
     # Multiple syllables (estimated)
-    vowel_groups = re.findall(r'[aeiou]+', word)
-    syllables = len(vowel_groups)
-    if syllables >= 4:
-        score += 20
-    elif syllables >= 3:
-        score += 10
-
-    return min(100, max(0, score))
-
-# Load words
-words = []
-with open('psychometric_words_clean.txt', 'r', encoding='utf-8') as f:
-    for line in f:
-        line = line.strip()
-        if line:
-            parts = line.split('\t')
-            if len(parts) == 2:
-                english = parts[0].strip()
-                hebrew = parts[1].strip()
-
-                # Quality filters
-                if (english and hebrew and
-                    3 <= len(english) <= 20 and  # Reasonable length
-                    english.count(' ') <= 1 and  # Max 2-word phrases
-                    not any(c.isdigit() for c in english)):  # No numbers
-
-                    words.append({
-                        'english': english,
-                        'hebrew': hebrew,
-                        'difficulty': calculate_difficulty(english)
-                    })
-
-print(f"Loaded {len(words)} valid words")
-
-# Sort by difficulty
-words.sort(key=lambda w: (w['difficulty'], w['english'].lower()))
+    syllables = np.fromiter((len(_VOWEL_RE.findall(w)) for w in words), dtype=np.int16, count=n)
+    score += np.select([syllables >= 4, syllables >= 3], [20, 10], 0).astype(np.int16)
+
+    return np.clip(score, 0, 100)
+
+# Load words as (english, hebrew, difficulty) tuples
+rows = []
+words_lower = []
+lengths = []
+with open(SOURCE_PATH, 'r', encoding='utf-8', newline='') as f:
+    for row in csv.reader(f, delimiter='\t', quoting=csv.QUOTE_NONE):
+        if len(row) == 2:
+            english, hebrew = row[0].strip(), row[1].strip()
+            length = len(english)
+
+            # Quality filters
+            if (english and hebrew and
+                3 <= length <= 20 and  # Reasonable length
+                english.count(' ') <= 1 and  # Max 2-word phrases
+                not any(c.isdigit() for c in english)):  # No numbers
+
+                rows.append((english, hebrew))
+                words_lower.append(english.lower())
+                lengths.append(length)
+
+difficulties = calculate_difficulty(words_lower, lengths)
+
+print(f"Loaded {len(rows)} valid words")
+
+# Sort by difficulty, then alphabetically (lexsort is stable and takes the primary key last)
+order = np.lexsort((np.array(words_lower), difficulties))
+words = [(*rows[j], int(difficulties[j])) for j in order]
 
 print(f"\nEasiest 10:")
-for i, w in enumerate(words[:10], 1):
-    print(f"{i:2d}. {w['english']:20s} → {w['hebrew']:25s} (score: {w['difficulty']:3d})")
+for i, (english, hebrew, difficulty) in enumerate(words[:10], 1):
+    print(f"{i:2d}. {english:20s} → {hebrew:25s} (score: {difficulty:3d})")
 
 print(f"\nHardest 10:")
-for i, w in enumerate(words[-10:], len(words)-9):
-    print(f"{i:4d}. {w['english']:20s} → {w['hebrew']:25s} (score: {w['difficulty']:3d})")
+for i, (english, hebrew, difficulty) in enumerate(words[-10:], len(words)-9):
+    print(f"{i:4d}. {english:20s} → {hebrew:25s} (score: {difficulty:3d})")
 
 # Select EXACTLY 400 words evenly distributed
 total_words = len(words)
@@ -169,7 +167,8 @@ selected = []
 for i in range(400):
     idx = int(i * step)
     if idx < len(words):
-        selected.append(words[idx])
+        english, hebrew, difficulty = words[idx]
+        selected.append({'english': english, 'hebrew': hebrew, 'difficulty': difficulty})
 
 # Assign ranks: EXACTLY 20 words per level
 for i, word in enumerate(selected):
@@ -183,10 +182,7 @@ for i, word in enumerate(selected):
 print(f"\n✅ Selected {len(selected)} words")
 
 # Verify distribution
-level_counts = {}
-for word in selected:
-    level = word['level']
-    level_counts[level] = level_counts.get(level, 0) + 1
+level_counts = Counter(word['level'] for word in selected)
 
 print("\n📊 Distribution verification:")
 all_perfect = True
@@ -203,132 +199,12 @@ else:
     print("\n❌ ERROR: Distribution not perfect!")
     sys.exit(1)
 
-# Generate seed file
-output = '''"""
-Seed script for Israeli Psychometric Entrance Test vocabulary.
-STRICT CURATED VERSION:
-- EXACTLY 400 authentic psychometric words from source CSV
-- EXACTLY 20 words per level across 20 levels
-- Authentic Hebrew translations from test prep materials
-- Difficulty calculated by word complexity, frequency, and structure
-"""
-import asyncio
-import sys
-from sqlalchemy import select, delete
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from app.db.session import engine, AsyncSessionLocal, Base
-from app.models.word import Word
-
-
-# 400 AUTHENTIC Israeli Psychometric Test words
-# PERFECT distribution: 20 levels × 20 words = 400
-# Difficulty progression: easiest → hardest
-# Level = ceil(difficulty_rank / 5)
-PSYCHOMETRIC_WORDS = [
-'''
-
-current_level = 0
-for word in selected:
-    level = word['level']
-    rank = word['rank']
-
-    if level != current_level:
-        output += f'\n    # ===== LEVEL {level} (ranks {((level-1)*5)+1}-{level*5}) - EXACTLY 20 WORDS =====\n'
-        current_level = level
-
-    output += f'    {{"english": "{word["english"]}", "hebrew": "{word["hebrew"]}", "difficulty_rank": {rank}}},\n'
-
-output += ''']
-
-
-async def seed_words(session: AsyncSession):
-    """Seed database with EXACTLY 400 authentic psychometric words."""
-    print("\\n" + "=" * 70)
-    print("🇮🇱 STRICT PSYCHOMETRIC VOCABULARY SEEDER 🇮🇱")
-    print("=" * 70)
-
-    # Clear existing words
-    print("[INFO] Clearing existing words...")
-    await session.execute(delete(Word))
-    await session.commit()
-    print("[CLEARED] ✅ Database wiped clean")
-
-    # Insert words
-    print(f"[SEEDING] Inserting {len(PSYCHOMETRIC_WORDS)} authentic words...")
-    for word_data in PSYCHOMETRIC_WORDS:
-        word = Word(
-            english=word_data["english"],
-            hebrew=word_data["hebrew"],
-            difficulty_rank=word_data["difficulty_rank"]
-        )
-        session.add(word)
-
-    await session.commit()
-    print(f"[SUCCESS] ✅ Inserted {len(PSYCHOMETRIC_WORDS)} words")
-
-    # Verify count
-    stmt = select(Word)
-    result = await session.execute(stmt)
-    total = len(result.scalars().all())
-
-    if total != 400:
-        print(f"[ERROR] ❌ Expected 400, found {total}")
-    else:
-        print(f"[VERIFY] ✅ Perfect count: {total} words")
-
-    # Verify distribution
-    print("\\n[DISTRIBUTION] Verifying 20 words per level:")
-    all_good = True
-    for level in range(1, 21):
-        min_rank = (level - 1) * 5 + 1
-        max_rank = level * 5
-        stmt = select(Word).where(
-            Word.difficulty_rank >= min_rank,
-            Word.difficulty_rank <= max_rank
-        )
-        result = await session.execute(stmt)
-        count = len(result.scalars().all())
-        status = "✅" if count == 20 else "❌"
-        print(f"  Level {level:2d} (ranks {min_rank:2d}-{max_rank:3d}): {count:2d} words {status}")
-        if count != 20:
-            all_good = False
-
-    if all_good:
-        print("\\n[SUCCESS] ✅✅✅ PERFECT DISTRIBUTION: 20 words × 20 levels = 400")
-    else:
-        print("\\n[ERROR] ❌ Distribution not perfect")
-
-
-async def main():
-    """Main seeder function."""
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-    async with AsyncSessionLocal() as session:
-        await seed_words(session)
-
-    print("\\n" + "=" * 70)
-    print("✅ SEEDING COMPLETE - DATABASE READY")
-    print("=" * 70)
-
-
-if __name__ == "__main__":
-    if sys.platform == 'win32':
-        try:
-            sys.stdout.reconfigure(encoding='utf-8')
-        except AttributeError:
-            import codecs
-            sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
-
-    asyncio.run(main())
-'''
-
-with open('backend/app/seed_psychometric_data.py', 'w', encoding='utf-8') as f:
-    f.write(output)
-
-print(f"\n✅✅✅ PERFECT seed file created!")
-print(f"📁 Location: backend/app/seed_psychometric_data.py")
+# Write the selection in database_english.json's unit layout for the backend seeder
+write_seed_words(selected, source_sha256)
+
+print(f"\n✅✅✅ PERFECT seed words written!")
+print(f"📁 Location: {OUTPUT_PATH}")
 print(f"📊 Distribution: EXACTLY 20 words × 20 levels = 400 total")
 print(f"🎯 Difficulty: Properly scored and distributed")
 print(f"🇮🇱 Translations: Authentic from source CSV")
+print("Seed it: cd backend && python -m app.seed_psychometric_data ../seed_psychometric_words.json")
@@ -2,72 +2,72 @@
 Parse psychometric vocabulary from CSV and prepare for database seeding.
 """
 import csv
-import sys
 import re
 
-# Fix Windows encoding
-if sys.platform == 'win32':
-    try:
-        sys.stdout.reconfigure(encoding='utf-8')
-    except AttributeError:
-        import codecs
-        sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
-
-# Read the CSV file using proper CSV parsing
-words = []
-with open('psychometric_words.csv.csv', 'r', encoding='utf-8') as f:
-    reader = csv.reader(f)
-    for row in reader:
-        # Skip empty rows
-        if not row or all(not cell.strip() for cell in row):
-            continue
-
-        # Process pairs: english,hebrew,english,hebrew...
-        for i in range(0, len(row), 2):
-            if i + 1 < len(row):
+from console_encoding import ensure_utf8_stdout
+
+ensure_utf8_stdout()
+
+# Leading list numbering such as "12. " or "3 "
+_LEADING_NUMBER_RE = re.compile(r'^\d+\.?\s*')
+
+
+def _clean_english(english):
+    """Remove leading numbers, parentheses and alternative spellings ("a/b")."""
+    english = _LEADING_NUMBER_RE.sub('', english).strip()
+    return english.split('(', 1)[0].split('/', 1)[0].strip()
+
+
+def _clean_hebrew(hebrew):
+    """Remove leading numbers and keep only the first translation."""
+    hebrew = _LEADING_NUMBER_RE.sub('', hebrew).strip()
+    return hebrew.split(',', 1)[0].strip()
+
+
+def _read_pairs(path):
+    """Yield cleaned (english, hebrew) pairs from the english,hebrew,english,hebrew... CSV."""
+    with open(path, 'r', encoding='utf-8') as f:
+        for row in csv.reader(f):
+            # Skip empty rows
+            if not row or all(not cell.strip() for cell in row):
+                continue
+
+            # Process pairs: english,hebrew,english,hebrew...
+            for i in range(0, len(row) - 1, 2):
                 english = row[i].strip()
                 hebrew = row[i + 1].strip()
 
                 # Skip empty pairs or invalid entries
                 if english and hebrew and len(english) > 1:
-                    # Clean up english word (remove numbers, parentheses for main word)
-                    english_clean = re.sub(r'^\d+\.?\s*', '', english).strip()  # Remove leading numbers
-                    english_clean = english_clean.split('(')[0].strip()  # Remove parentheses
-                    english_clean = english_clean.split('/')[0].strip()  # Take first option if multiple
-
-                    # Clean up hebrew (take first translation if multiple, remove numbers)
-                    hebrew_clean = re.sub(r'^\d+\.?\s*', '', hebrew).strip()
-                    hebrew_clean = hebrew_clean.split(',')[0].strip()  # Take first translation
+                    english_clean = _clean_english(english)
+                    hebrew_clean = _clean_hebrew(hebrew)
 
                     if english_clean and hebrew_clean and len(english_clean) > 1:
-                        words.append({
-                            'english': english_clean,
-                            'hebrew': hebrew_clean
-                        })
-
-# Remove duplicates (keep first occurrence)
-seen = set()
-unique_words = []
-for word in words:
-    key = word['english'].lower()
-    if key not in seen:
-        seen.add(key)
-        unique_words.append(word)
-
-print(f"Total words extracted: {len(words)}")
+                        yield english_clean, hebrew_clean
+
+
+# Read and dedup in one pass (keep first occurrence; dicts preserve insertion order)
+total_words = 0
+seen = {}
+for english, hebrew in _read_pairs('psychometric_words.csv.csv'):
+    total_words += 1
+    seen.setdefault(english.lower(), (english, hebrew))
+unique_words = list(seen.values())
+
+print(f"Total words extracted: {total_words}")
 print(f"Unique words: {len(unique_words)}")
 print("\nFirst 20 words:")
-for i, word in enumerate(unique_words[:20], 1):
-    print(f"{i}. {word['english']} → {word['hebrew']}")
+for i, (english, hebrew) in enumerate(unique_words[:20], 1):
+    print(f"{i}. {english} → {hebrew}")
 
 print("\nLast 10 words:")
-for i, word in enumerate(unique_words[-10:], len(unique_words)-9):
-    print(f"{i}. {word['english']} → {word['hebrew']}")
+for i, (english, hebrew) in enumerate(unique_words[-10:], len(unique_words)-9):
+    print(f"{i}. {english} → {hebrew}")
 
 # Save to a clean file
 with open('psychometric_words_clean.txt', 'w', encoding='utf-8') as f:
-    for word in unique_words:
-        f.write(f"{word['english']}\t{word['hebrew']}\n")
+    for english, hebrew in unique_words:
+        f.write(f"{english}\t{hebrew}\n")
 
 print(f"\nClean word list saved to: psychometric_words_clean.txt")
 print(f"Ready to create seed file with {len(unique_words)} authentic psychometric words!")
@@ -7,13 +7,9 @@ import sys
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
-# Fix Windows encoding
-if sys.platform == 'win32':
-    try:
-        sys.stdout.reconfigure(encoding='utf-8')
-    except AttributeError:
-        import codecs
-        sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
+from console_encoding import ensure_utf8_stdout
+
+ensure_utf8_stdout()
 
 # Import from backend
 sys.path.insert(0, 'backend')
@@ -21,25 +17,35 @@ from app.db.session import AsyncSessionLocal
 from app.models.word import Word
 
 
-async def get_random_word_from_level(db: AsyncSession, level: int):
-    """Get a random word from a specific level."""
-    # Calculate rank range for this level
-    min_rank = (level - 1) * 5 + 1
-    max_rank = level * 5
-
-    # Query random word from this level
-    stmt = (
-        select(Word)
-        .where(Word.difficulty_rank >= min_rank)
-        .where(Word.difficulty_rank <= max_rank)
-        .order_by(func.random())
-        .limit(1)
+async def get_random_words_by_level(db: AsyncSession, levels: list[int]) -> dict:
+    """Get one random word for each level in a single query."""
+    # Level = ceil(difficulty_rank / 5)
+    level_expr = (Word.difficulty_rank - 1) // 5 + 1
+
+    # Shuffle each level's words and keep the first one
+    ranked = (
+        select(
+            Word.id,
+            level_expr.label("level"),
+            func.row_number().over(partition_by=level_expr, order_by=func.random()).label("pick"),
+        )
+        .where(level_expr.in_(levels))
+        .subquery()
     )
+    stmt = select(ranked.c.level, Word).join(Word, Word.id == ranked.c.id).where(ranked.c.pick == 1)
 
     result = await db.execute(stmt)
-    word = result.scalar_one_or_none()
+    return {level: word for level, word in result.all()}
+
 
-    return word
+async def get_level_counts(db: AsyncSession) -> dict:
+    """Count words per level with one grouped query."""
+    # The NULL/out-of-range groups are kept so the counts still sum to the total
+    level_expr = ((Word.difficulty_rank - 1) // 5 + 1).label("level")
+    stmt = select(level_expr, func.count(Word.id)).group_by("level")
+
+    result = await db.execute(stmt)
+    return {level: count for level, count in result.all()}
 
 
 async def main():
@@ -49,54 +55,49 @@ async def main():
     print("=" * 70)
     print()
 
-    async with AsyncSessionLocal() as db:
-        # Get random words from each level
-        levels_to_check = [1, 10, 20]
+    # The sample and the counts are independent, so run them concurrently on
+    # two sessions (one AsyncSession can't run two queries at once)
+    levels_to_check = [1, 10, 20]
+    async with AsyncSessionLocal() as sample_db, AsyncSessionLocal() as count_db:
+        words_by_level, level_counts = await asyncio.gather(
+            get_random_words_by_level(sample_db, levels_to_check),
+            get_level_counts(count_db),
+        )
 
+        # Random words from each level
         for level in levels_to_check:
-            word = await get_random_word_from_level(db, level)
+            word = words_by_level.get(level)
 
             if word:
                 print(f"[Level {level:2d}] - {word.english:20s} - {word.hebrew}")
             else:
                 print(f"[Level {level:2d}] - ❌ NO WORD FOUND")
 
-        print()
-
-        # Get total count per level
-        print("=" * 70)
-        print("📊 DISTRIBUTION CHECK: Words per level")
-        print("=" * 70)
-        print()
-
-        for level in [1, 5, 10, 15, 20]:
-            min_rank = (level - 1) * 5 + 1
-            max_rank = level * 5
+    print()
 
-            stmt = (
-                select(func.count(Word.id))
-                .where(Word.difficulty_rank >= min_rank)
-                .where(Word.difficulty_rank <= max_rank)
-            )
+    # Total count per level
+    print("=" * 70)
+    print("📊 DISTRIBUTION CHECK: Words per level")
+    print("=" * 70)
+    print()
 
-            result = await db.execute(stmt)
-            count = result.scalar()
+    total = sum(level_counts.values())
 
-            status = "✅" if count == 20 else "❌"
-            print(f"Level {level:2d} (ranks {min_rank:2d}-{max_rank:3d}): {count:2d} words {status}")
+    for level in [1, 5, 10, 15, 20]:
+        min_rank = (level - 1) * 5 + 1
+        max_rank = level * 5
+        count = level_counts.get(level, 0)
 
-        # Total count
-        stmt = select(func.count(Word.id))
-        result = await db.execute(stmt)
-        total = result.scalar()
+        status = "✅" if count == 20 else "❌"
+        print(f"Level {level:2d} (ranks {min_rank:2d}-{max_rank:3d}): {count:2d} words {status}")
 
-        print()
-        print(f"Total words in database: {total}")
+    print()
+    print(f"Total words in database: {total}")
 
-        if total == 400:
-            print("✅ PERFECT: 400 words")
-        else:
-            print(f"❌ ERROR: Expected 400, found {total}")
+    if total == 400:
+        print("✅ PERFECT: 400 words")
+    else:
+        print(f"❌ ERROR: Expected 400, found {total}")
 
     print()
     print("=" * 70)
@@ -0,0 +1,32 @@
+"""
+Output step shared by the root-level seed word generators.
+"""
+import json
+
+OUTPUT_PATH = 'seed_psychometric_words.json'
+
+# The live seeder groups words into 10 units; difficulty ranks run 1-100
+UNIT_COUNT = 10
+
+
+def rank_to_unit(rank):
+    """Map a difficulty rank (1-100) to a unit number (1-UNIT_COUNT)"""
+    return (rank - 1) * UNIT_COUNT // 100 + 1
+
+
+def write_seed_words(words, source_sha256=None):
+    """
+    Write ranked words in database_english.json's layout: {"Unit N": {english: hebrew}}.
+
+    backend/app/seed_psychometric_data.py loads the result directly:
+        cd backend && python -m app.seed_psychometric_data ../seed_psychometric_words.json
+    source_sha256, when given, is stored as a top-level key for the up-to-date check.
+    """
+    units = {f"Unit {n}": {} for n in range(1, UNIT_COUNT + 1)}
+    for w in words:
+        units[f"Unit {rank_to_unit(w['rank'])}"][w['english']] = w['hebrew']
+
+    data = {'source_sha256': source_sha256} if source_sha256 else {}
+    data.update(units)
+    with open(OUTPUT_PATH, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)